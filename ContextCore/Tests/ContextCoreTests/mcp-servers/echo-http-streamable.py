@@ -2,42 +2,59 @@
 # requires-python = ">=3.13"
 # dependencies = [
 #     "fastmcp",
+#     "httptools",
+#     "uvloop",
 # ]
 # ///
 import argparse
-from typing import Any
-from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
-from starlette.requests import Request
-from starlette.responses import Response
-from starlette.types import ASGIApp
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 from starlette.middleware import Middleware as ASGIMiddleware
 
 from fastmcp import FastMCP
 
+# Raw ASGI header names/values compared against on every response start
+_CONTENT_TYPE = b"content-type"
+_EVENT_STREAM = b"text/event-stream"
+_APPLICATION_JSON = b"application/json"
 
-class CustomHeaderMiddleware(BaseHTTPMiddleware):
+
+class CustomHeaderMiddleware:
     """
-    A Starlette-compatible ASGI middleware to inject custom HTTP headers into responses.
+    A pure ASGI middleware to inject custom HTTP headers into responses.
     """
-    def __init__(self, app: ASGIApp, keep_alive_timeout: int = None):
-        super().__init__(app)
+    def __init__(self, app: ASGIApp, keep_alive_timeout: int | None = None):
+        self.app = app
         self.keep_alive_timeout = keep_alive_timeout
-
-    async def dispatch(self, request: Request, call_next: RequestResponseEndpoint) -> Response:
-        # First, we let the request go through the rest of the application
-        # to get the response object.
-        response = await call_next(request)
-        
+        # The timeout is fixed for the lifetime of the server, so build the
+        # header tuples once rather than formatting them on every response
+        if keep_alive_timeout is not None:
+            self._keep_alive_headers = [
+                (b"connection", b"Keep-Alive"),
+                (b"keep-alive", f"timeout={keep_alive_timeout}, max=1000".encode("ascii")),
+            ]
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         # Only add Keep-Alive headers if a timeout was specified
-        if self.keep_alive_timeout is not None:
-            # Now, we modify the headers on the outgoing response.
-            # Check content type of response to add Keep-Alive headers
-            content_type = response.headers.get("content-type", "")
-            if "text/event-stream" in content_type or "application/json" in content_type:
-                response.headers["Connection"] = "Keep-Alive"
-                response.headers["Keep-Alive"] = f"timeout={self.keep_alive_timeout}, max=1000"
-        
-        return response
+        if scope["type"] != "http" or self.keep_alive_timeout is None:
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_keep_alive(message: Message) -> None:
+            # Modify the headers on the outgoing response as it starts, without
+            # buffering the body so SSE streams are passed straight through.
+            if message["type"] == "http.response.start":
+                # Check content type of response to add Keep-Alive headers
+                headers = message.get("headers", [])
+                content_type = next((value for name, value in headers if name == _CONTENT_TYPE), b"")
+                if content_type.startswith((_EVENT_STREAM, _APPLICATION_JSON)):
+                    # Replace any Connection/Keep-Alive headers set by the application
+                    message["headers"] = [
+                        (name, value) for name, value in headers
+                        if name not in (b"connection", b"keep-alive")
+                    ] + self._keep_alive_headers
+            await send(message)
+
+        await self.app(scope, receive, send_with_keep_alive)
 
 
 mcp = FastMCP("Echo")
@@ -84,5 +101,7 @@ if __name__ == "__main__":
     
     # Run the app
     import uvicorn
-    uvicorn.run(app, host="127.0.0.1", port=args.port)
+    uvicorn.run(app, host="127.0.0.1", port=args.port, loop="uvloop",
+                http="httptools", ws="none", access_log=False,
+                date_header=False, server_header=False)
 
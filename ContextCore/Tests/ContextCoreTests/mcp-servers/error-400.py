@@ -1,68 +1,104 @@
 # /// script
 # requires-python = ">=3.13"
 # dependencies = [
-#     "fastapi",
+#     "httptools",
+#     "orjson",
 #     "uvicorn",
+#     "uvloop",
 # ]
 # ///
 import argparse
-import json
-from fastapi import FastAPI, Request, Response
-from fastapi.responses import JSONResponse
+from pathlib import Path
 
-app = FastAPI()
+import orjson
 
-@app.post("/mcp")
-async def handle_mcp_request(request: Request):
-    """Always return HTTP 400 with a JSON-RPC error response"""
-    body = await request.json()
-    
-    # Create a JSON-RPC error response
-    error_response = {
-        "jsonrpc": "2.0",
-        "error": {
-            "code": -32600,
-            "message": "The data couldn't be read because it isn't in the correct format."
-        },
-        "id": body.get("id")  # Use the same ID from the request
-    }
-    
-    return JSONResponse(
-        status_code=400,
-        content=error_response,
-        headers={
-            "Content-Type": "application/json",
-            "Access-Control-Allow-Origin": "*"
-        }
-    )
+# The JSON-RPC error response is identical for every request apart from the
+# echoed ID, so serialize everything around the ID once at startup.
+_ERROR_PREFIX = (
+    b'{"jsonrpc":"2.0","error":{"code":-32600,'
+    b'"message":"The data couldn\'t be read because it isn\'t in the correct format."},"id":'
+)
+_ERROR_SUFFIX = b"}"
+_SSE_ERROR_BODY = _ERROR_PREFIX + b"null" + _ERROR_SUFFIX
+_ERROR_HEADERS = [
+    (b"content-type", b"application/json"),
+    (b"access-control-allow-origin", b"*"),
+]
+
+_METHOD_NOT_ALLOWED_BODY = b'{"detail":"Method Not Allowed"}'
+_NOT_FOUND_BODY = b'{"detail":"Not Found"}'
+
+
+async def _send_response(send, status: int, body: bytes, headers=_ERROR_HEADERS) -> None:
+    await send({
+        "type": "http.response.start",
+        "status": status,
+        "headers": [*headers, (b"content-length", str(len(body)).encode())],
+    })
+    await send({"type": "http.response.body", "body": body})
+
+
+async def _read_body(receive) -> bytes:
+    body = b""
+    more_body = True
+    while more_body:
+        message = await receive()
+        body += message.get("body", b"")
+        more_body = message.get("more_body", False)
+    return body
+
+
+def _request_id(body: bytes) -> bytes:
+    """Return the JSON-encoded id of a JSON-RPC request body"""
+    try:
+        return orjson.dumps(orjson.loads(body).get("id"))
+    except (orjson.JSONDecodeError, AttributeError):
+        return b"null"
+
+
+async def app(scope, receive, send) -> None:
+    """Always return HTTP 400 with a JSON-RPC error response for /mcp"""
+    if scope["type"] != "http":
+        return
+
+    if scope["path"] != "/mcp":
+        await _send_response(send, 404, _NOT_FOUND_BODY, [(b"content-type", b"application/json")])
+        return
+
+    method = scope["method"]
+    if method == "POST":
+        # Use the same ID from the request
+        request_id = _request_id(await _read_body(receive))
+        await _send_response(send, 400, _ERROR_PREFIX + request_id + _ERROR_SUFFIX)
+    elif method == "GET":
+        # Return 400 for SSE requests with same error as POST
+        await _send_response(send, 400, _SSE_ERROR_BODY)
+    else:
+        await _send_response(
+            send,
+            405,
+            _METHOD_NOT_ALLOWED_BODY,
+            [(b"content-type", b"application/json"), (b"allow", b"GET, POST")],
+        )
 
-@app.get("/mcp")
-async def handle_sse_request():
-    """Return 400 for SSE requests with same error as POST"""
-    error_response = {
-        "jsonrpc": "2.0",
-        "error": {
-            "code": -32600,
-            "message": "The data couldn't be read because it isn't in the correct format."
-        },
-        "id": None
-    }
-    
-    return JSONResponse(
-        status_code=400,
-        content=error_response,
-        headers={
-            "Content-Type": "application/json",
-            "Access-Control-Allow-Origin": "*"
-        }
-    )
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Error 400 MCP Server")
     parser.add_argument("--port", "-p", type=int, default=9000,
                        help="Port number to run the server on (default: 9000)")
+    parser.add_argument("--workers", "-w", type=int, default=1,
+                       help="Number of worker processes to run (default: 1)")
     
     args = parser.parse_args()
+    if args.workers < 1:
+        parser.error("--workers must be at least 1")
     
     import uvicorn
-    uvicorn.run(app, host="127.0.0.1", port=args.port)
\ No newline at end of file
+    # The server is stateless, so it can be spread across multiple worker
+    # processes. Uvicorn needs an import string rather than the app object to
+    # spawn them.
+    uvicorn.run(app if args.workers == 1 else f"{Path(__file__).stem}:app",
+                app_dir=str(Path(__file__).parent), workers=args.workers,
+                host="127.0.0.1", port=args.port, loop="uvloop",
+                http="httptools", ws="none", access_log=False,
+                date_header=False, server_header=False, lifespan="off")
\ No newline at end of file
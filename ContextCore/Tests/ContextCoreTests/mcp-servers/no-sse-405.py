@@ -2,32 +2,47 @@
 # requires-python = ">=3.13"
 # dependencies = [
 #     "fastmcp",
+#     "httptools",
+#     "orjson",
+#     "uvloop",
 # ]
 # ///
 import argparse
-from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
-from starlette.requests import Request
-from starlette.responses import Response, JSONResponse
-from starlette.types import ASGIApp
+import orjson
+from starlette.types import ASGIApp, Receive, Scope, Send
 from starlette.middleware import Middleware as ASGIMiddleware
 from fastmcp import FastMCP
 
+# The rejection is identical for every request, so build its ASGI messages once
+_REJECT_BODY = orjson.dumps({"error": "Method Not Allowed", "message": "SSE streams not supported"})
+_REJECT_START = {
+    "type": "http.response.start",
+    "status": 405,
+    "headers": [
+        (b"allow", b"POST, DELETE, OPTIONS"),
+        (b"content-type", b"application/json"),
+        (b"content-length", str(len(_REJECT_BODY)).encode()),
+    ],
+}
+_REJECT_BODY_MESSAGE = {"type": "http.response.body", "body": _REJECT_BODY}
 
-class NoSSEMiddleware(BaseHTTPMiddleware):
+
+class NoSSEMiddleware:
     """Middleware that simulates environments where SSE is not supported by rejecting GET SSE requests."""
-    
-    async def dispatch(self, request: Request, call_next: RequestResponseEndpoint) -> Response:
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         # Intercept GET requests to /mcp endpoint
-        if request.method == "GET" and request.url.path == "/mcp":
+        if scope["type"] == "http" and scope["method"] == "GET" and scope["path"] == "/mcp":
             # Return 405 Method Not Allowed for GET requests (no SSE support)
-            return JSONResponse(
-                {"error": "Method Not Allowed", "message": "SSE streams not supported"},
-                status_code=405,
-                headers={"Allow": "POST, DELETE, OPTIONS"}
-            )
-        
+            await send(_REJECT_START)
+            await send(_REJECT_BODY_MESSAGE)
+            return
+
         # Let other requests proceed normally
-        return await call_next(request)
+        await self.app(scope, receive, send)
 
 
 # Create MCP server instance
@@ -65,4 +80,6 @@ if __name__ == "__main__":
     
     # Run the app
     import uvicorn
-    uvicorn.run(app, host="127.0.0.1", port=args.port)
\ No newline at end of file
+    uvicorn.run(app, host="127.0.0.1", port=args.port, loop="uvloop",
+                http="httptools", ws="none", access_log=False,
+                date_header=False, server_header=False)
\ No newline at end of file
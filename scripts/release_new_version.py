@@ -5,8 +5,9 @@
 #     "rich>=13.7.0",
 #     "click>=8.1.7",
 #     "lxml>=5.1.0",
-#     "markdown2>=2.4.12",
+#     "cmarkgfm>=2024.1.14",
 #     "pyyaml>=6.0.1",
+#     "zstandard>=0.22.0",
 # ]
 # ///
 """
@@ -17,21 +18,35 @@ Environment Variables:
     APPLE_KEYCHAIN_PROFILE: Name of the Keychain item created by running:
         `$(xcode-select -p)/usr/bin/notarytool store-credentials`
         Defaults to "App Store Connect Profile"
+    KEYCHAIN_PASSWORD: Password used to unlock the signing keychain before
+        code signing (optional)
+    KEYCHAIN_PATH: Keychain containing the Developer ID certificate
+        Defaults to the default keychain
 """
 
 import argparse
+import hashlib
+import json
+import mmap
 import re
 import subprocess
 import sys
 import os
+import plistlib
 import shutil
+import tempfile
 import time
 import yaml  # type: ignore[import]
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed, wait
+from contextlib import contextmanager
+from dataclasses import dataclass
 from datetime import datetime, timezone
+from functools import cache
 from pathlib import Path
-from typing import Tuple, Optional, Dict, List, Any, Union
+from typing import Tuple, Optional, Dict, List, Set, Any, Callable, Iterator, Union
 import xml.etree.ElementTree as ET
-from rich.console import Console  # type: ignore[import]
+from xml.sax.saxutils import escape, quoteattr
+from rich.console import Console, Group  # type: ignore[import]
 from rich.progress import (  # type: ignore[import]
     Progress,
     SpinnerColumn,
@@ -45,10 +60,24 @@ from rich.table import Table  # type: ignore[import]
 from rich.tree import Tree  # type: ignore[import]
 from rich.rule import Rule  # type: ignore[import]
 from rich.syntax import Syntax  # type: ignore[import]
+from rich.text import Text  # type: ignore[import]
 from rich.prompt import Confirm  # type: ignore[import]
 from rich import print as rprint  # type: ignore[import]
 from lxml import etree  # type: ignore[import]
-import markdown2  # type: ignore[import]
+import cmarkgfm  # type: ignore[import]
+from cmarkgfm.cmark import Options as CmarkOptions  # type: ignore[import]
+
+# Prefer the LibYAML-backed loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as YAMLLoader  # type: ignore[import]
+except ImportError:
+    from yaml import SafeLoader as YAMLLoader  # type: ignore[import]
+
+# Optional, used to keep large rollback backups compressed in memory
+try:
+    import zstandard  # type: ignore[import]
+except ImportError:
+    zstandard = None
 
 console = Console()
 
@@ -60,6 +89,87 @@ VERBOSE: bool = False
 QUIET: bool = False
 DEBUG: bool = False
 
+# set-keychain-settings arguments that restore the default keychain's auto-lock
+# settings, if the release changed them
+KEYCHAIN_SETTINGS_TO_RESTORE: Optional[List[str]] = None
+
+# Xcode project patterns. buildSettings blocks in project.pbxproj normally don't
+# nest braces, so a block runs from its opening brace to the first closing one.
+# Blocks that do nest are detected by comparing against BUILD_SETTINGS_START_RE.
+BUILD_SETTINGS_RE = re.compile(r"buildSettings\s*=\s*\{([^{}]*)\};")
+BUILD_SETTINGS_START_RE = re.compile(r"buildSettings\s*=\s*\{")
+CURRENT_VERSION_RE = re.compile(r"CURRENT_PROJECT_VERSION = (\d+);")
+MARKETING_VERSION_RE = re.compile(r"MARKETING_VERSION = ([\d.]+);")
+
+# CHANGELOG.md patterns. Group 1 is the section header, group 2 its content.
+UNRELEASED_RE = re.compile(r"(## Unreleased\n)(.*?)(?=\n## |$)", re.DOTALL)
+
+# Opening tag of links in rendered Markdown, used to make them open in a new window
+LINK_TAG_RE = re.compile(r"<a href=")
+
+# Opening line of a fenced code block in Markdown. Group 1 is the fence.
+MARKDOWN_FENCE_RE = re.compile(r" {0,3}(`{3,}|~{3,})")
+
+# Opening line of a Markdown HTML block: a comment, a block-level tag, or any
+# other tag alone on its line
+MARKDOWN_HTML_BLOCK_RE = re.compile(
+    r" {0,3}(?:<!--|<[?!]"
+    r"|</?(?:address|article|aside|blockquote|body|details|dialog|dd|div|dl|dt|"
+    r"fieldset|figcaption|figure|footer|form|h[1-6]|head|header|hr|html|iframe|li|"
+    r"main|nav|ol|p|pre|script|section|style|summary|table|tbody|td|textarea|"
+    r"tfoot|th|thead|tr|ul)(?:[\s/>]|$)"
+    r"|</?[A-Za-z][\w-]*(?:\s[^<>]*)?/?>\s*$)",
+    re.IGNORECASE,
+)
+
+# Inline Markdown whose underscores are rendered verbatim (group 1: backslash
+# escapes, code spans, raw HTML tags and autolinks; group 2 is a code span's
+# backticks), or a run of underscores (group 3)
+MARKDOWN_INLINE_RE = re.compile(
+    r"(\\."
+    r"|(?<!`)(`+)(?!`).*?(?<!`)\2(?!`)"
+    r"|<[^<>\n]*>"
+    r"|(?:https?://|ftp://|www\.)[^\s<]*"
+    r"|[\w.+-]+@[\w-]+(?:\.[\w-]+)+)"
+    r"|(_+)",
+    re.DOTALL,
+)
+
+# Parsed copies of app.yml, keyed by the config file's path
+CONFIG_CACHE_DIR = Path.home() / ".cache" / "context-release"
+
+# Skip `git fetch` during pre-flight checks if the last one is younger than this (seconds)
+FETCH_MAX_AGE = 300
+
+# Semantic version (X.Y.Z)
+SEMVER_RE = re.compile(r"^\d+\.\d+\.\d+$")
+
+# Sparkle sign_update output fields
+SPARKLE_SIGNATURE_RE = re.compile(r'sparkle:edSignature="([^"]+)"')
+SPARKLE_LENGTH_RE = re.compile(r'length="(\d+)"')
+
+# `dwarfdump --uuid` output: the UUID and architecture of each binary in a dSYM
+DWARF_UUID_RE = re.compile(rb"UUID: ([0-9A-F-]+) \(([^)]+)\)")
+
+# `codesign -dv` output: the signature's option flags and its secure timestamp
+CODESIGN_FLAGS_RE = re.compile(r"^CodeDirectory .*\bflags=0x[0-9a-f]+\(([^)]*)\)", re.MULTILINE)
+CODESIGN_TIMESTAMP_RE = re.compile(r"^Timestamp=", re.MULTILINE)
+
+# `security show-keychain-info` output: the auto-lock timeout, if there is one
+KEYCHAIN_TIMEOUT_RE = re.compile(r"\btimeout=(\d+)s")
+
+# How long the keychain must stay unlocked for, to outlast the build and notarization (seconds)
+KEYCHAIN_UNLOCK_SECONDS = 3600
+
+# XML namespace for the sparkle: elements in appcast.xml
+SPARKLE_NS = "http://www.andymatuschak.org/xml-namespaces/sparkle"
+
+# Static panel titles, parsed from markup once at import
+CHANGELOG_ITEMS_TITLE = Text.from_markup("[bold]Changelog Items[/bold]")
+NEW_CHANGELOG_ENTRIES_TITLE = Text.from_markup("[bold]New Changelog Entries[/bold]")
+RELEASE_SUMMARY_TITLE = Text.from_markup("[bold]🎉 Release Summary[/bold]")
+VERIFICATION_RESULTS_TITLE = Text.from_markup("[bold]Verification Results[/bold]")
+
 
 # Status icons
 class Icons:
@@ -70,6 +180,33 @@ class Icons:
     PROGRESS = "[cyan]➤[/cyan]"
 
 
+class _NullProgress:
+    """Stand-in for a rich Progress that displays nothing"""
+
+    def add_task(self, description: str, *args: Any, **kwargs: Any) -> int:
+        return 0
+
+    def update(self, task_id: int, *args: Any, **kwargs: Any) -> None:
+        pass
+
+    def advance(self, task_id: int, advance: float = 1) -> None:
+        pass
+
+
+@contextmanager
+def maybe_progress(*columns: Any) -> Iterator[Any]:
+    """Show a progress display with the given columns (a spinner and the task
+    description by default), or nothing in quiet mode so no refresh thread runs"""
+    if QUIET:
+        yield _NullProgress()
+        return
+
+    if not columns:
+        columns = (SpinnerColumn(), TextColumn("[progress.description]{task.description}"))
+    with Progress(*columns, console=console) as progress:
+        yield progress
+
+
 class ReleaseError(Exception):
     """Custom exception for release script errors"""
 
@@ -91,6 +228,92 @@ class Config:
         return self._config.get(key, default)
 
 
+@dataclass
+class ChangelogState:
+    """Contents of CHANGELOG.md as read by the release flow"""
+
+    path: Path
+    content: str
+    mtime_ns: int
+    unreleased_match: Optional[re.Match]
+
+    @classmethod
+    def read(cls, path: Path) -> "ChangelogState":
+        """Read the changelog and locate its '## Unreleased' section"""
+        mtime_ns = path.stat().st_mtime_ns
+        content = path.read_text(encoding="utf-8")
+        return cls(path, content, mtime_ns, UNRELEASED_RE.search(content))
+
+    def refreshed(self) -> "ChangelogState":
+        """Return this state, or a fresh read if the file changed on disk since"""
+        try:
+            if self.path.stat().st_mtime_ns == self.mtime_ns:
+                return self
+        except OSError:
+            pass
+        return ChangelogState.read(self.path)
+
+
+@dataclass(frozen=True)
+class DmgArtifact:
+    """The finished release DMG, stat-ed once when it's finalized"""
+
+    path: Path
+    stat: os.stat_result
+
+    @classmethod
+    def from_path(cls, path: Path) -> "DmgArtifact":
+        """Record a finished DMG, failing if it doesn't exist"""
+        try:
+            return cls(path, path.stat())
+        except FileNotFoundError:
+            raise ReleaseError(f"DMG not found at {path}") from None
+
+    @property
+    def size_mb(self) -> float:
+        return self.stat.st_size / (1 << 20)
+
+
+def _config_cache_path(config_path: Path) -> Path:
+    """Get the path of the parsed-config cache for a config file, kept outside
+    the repository and named after the config file's absolute path
+    """
+    key = hashlib.sha256(str(config_path.resolve()).encode()).hexdigest()[:16]
+    return CONFIG_CACHE_DIR / f"config-{key}.json"
+
+
+def _read_config_cache(config_path: Path, mtime_ns: int) -> Optional[Dict[str, Any]]:
+    """Return the cached parsed config if it was written for this mtime"""
+    try:
+        with open(_config_cache_path(config_path), "rb") as f:
+            header = json.loads(f.readline())
+            if header.get("__mtime_ns") != mtime_ns:
+                return None
+            return json.load(f)
+    except (OSError, ValueError, AttributeError):
+        return None
+
+
+def _write_config_cache(config_path: Path, mtime_ns: int, config_dict: Dict[str, Any]) -> None:
+    """Atomically write the parsed config cache, ignoring any failure"""
+    cache_path = _config_cache_path(config_path)
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        # Values YAML can produce but JSON can't (e.g. dates) make this raise,
+        # in which case the config simply isn't cached
+        content = json.dumps({"__mtime_ns": mtime_ns}) + "\n" + json.dumps(config_dict)
+        fd, tmp_path = tempfile.mkstemp(dir=cache_path.parent, prefix=cache_path.name, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(content)
+            os.replace(tmp_path, cache_path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    except (OSError, TypeError, ValueError):
+        pass
+
+
 def load_config(config_path: Optional[Path] = None) -> Config:
     """Load configuration from YAML file"""
     # If no explicit path provided, look for app.yml in current directory
@@ -121,13 +344,20 @@ You can also specify a custom configuration file path using:
         console.print(error_msg)
         raise ReleaseError("Configuration file not found")
 
+    # Reuse the JSON cache of the parsed config while app.yml is unchanged
+    mtime_ns = config_path.stat().st_mtime_ns
+    cached = _read_config_cache(config_path, mtime_ns)
+    if cached:
+        return Config(cached)
+
     try:
-        with open(config_path, "r") as f:
-            config_dict = yaml.safe_load(f)
+        with open(config_path, "rb") as f:
+            config_dict = yaml.load(f, Loader=YAMLLoader)
 
         if not config_dict:
             raise ReleaseError("Configuration file is empty")
 
+        _write_config_cache(config_path, mtime_ns, config_dict)
         return Config(config_dict)
 
     except yaml.YAMLError as e:
@@ -139,15 +369,33 @@ You can also specify a custom configuration file path using:
 class RollbackManager:
     """Manages rollback of changes if script fails"""
 
+    # Backups larger than this are kept zstd-compressed when zstandard is available
+    COMPRESSION_THRESHOLD = 256 * 1024
+
     def __init__(self):
-        self.backup_files = {}
+        # Maps each backed up file to (is_compressed, original bytes or zstd frame)
+        self.backup_files: Dict[Path, Tuple[bool, bytes]] = {}
         self.created_files = []
         self.temp_dirs = []
+        self.futures: List[Future] = []
+
+    def backup_file(self, filepath: Path, content: Optional[str] = None):
+        """Backup a file before modifying it, reusing its content if already read"""
+        # Keep the original contents if the file is modified more than once
+        if filepath in self.backup_files:
+            return
+
+        if content is not None:
+            data = content.encode("utf-8")
+        elif filepath.exists():
+            data = filepath.read_bytes()
+        else:
+            return
 
-    def backup_file(self, filepath: Path):
-        """Backup a file before modifying it"""
-        if filepath.exists():
-            self.backup_files[filepath] = filepath.read_text()
+        if zstandard is not None and len(data) > self.COMPRESSION_THRESHOLD:
+            self.backup_files[filepath] = (True, zstandard.ZstdCompressor(level=1).compress(data))
+        else:
+            self.backup_files[filepath] = (False, data)
 
     def track_created_file(self, filepath: Path):
         """Track a newly created file for deletion on rollback"""
@@ -157,14 +405,26 @@ class RollbackManager:
         """Track a temporary directory for cleanup"""
         self.temp_dirs.append(dirpath)
 
+    def track_future(self, future: Future) -> Future:
+        """Track background work to cancel or finish before rolling back"""
+        self.futures.append(future)
+        return future
+
     def rollback(self):
         """Rollback all tracked changes"""
         console.print("\n[yellow]Rolling back changes...[/yellow]")
 
+        # Stop background work that hasn't started, and let running work finish
+        # so it can't write anything after the rollback
+        pending = [future for future in self.futures if not future.cancel()]
+        wait(pending)
+
         # Restore backed up files
-        for filepath, content in self.backup_files.items():
+        for filepath, (compressed, data) in self.backup_files.items():
             try:
-                filepath.write_text(content)
+                if compressed:
+                    data = zstandard.ZstdDecompressor().decompress(data)
+                filepath.write_bytes(data)
                 console.print(f"  [dim]Restored {filepath}[/dim]")
             except Exception as e:
                 console.print(f"  [red]Failed to restore {filepath}: {e}[/red]")
@@ -190,14 +450,46 @@ class RollbackManager:
         console.print("[yellow]Rollback complete[/yellow]\n")
 
 
+def section_title(name: str) -> Text:
+    """Caption for the rule separating a phase of the release.
+
+    Built fresh for each rule, since Rule truncates its title Text in place.
+    """
+    return Text(name, style="bold blue")
+
+
+def decode_output(output: Union[str, bytes]) -> str:
+    """Decode captured subprocess output for display"""
+    if isinstance(output, bytes):
+        return output.decode("utf-8", "replace")
+    return output
+
+
+def read_log_tail(log_path: Path, max_lines: int = 50, max_bytes: int = 64 * 1024) -> str:
+    """Return the last lines of a log file, decoded for display"""
+    try:
+        with open(log_path, "rb") as f:
+            f.seek(0, os.SEEK_END)
+            f.seek(max(0, f.tell() - max_bytes))
+            data = f.read()
+    except OSError:
+        return ""
+    return "\n".join(decode_output(data).splitlines()[-max_lines:])
+
+
 def run_command(
     cmd: List[str],
     check: bool = True,
     capture_output: bool = True,
     show_output: Optional[bool] = None,
+    text: bool = False,
     **kwargs: Any,
-) -> subprocess.CompletedProcess[str]:
-    """Run a command with error handling"""
+) -> subprocess.CompletedProcess:
+    """Run a command with error handling.
+
+    Output is captured as bytes unless `text` is set, so callers that never look
+    at it don't pay for decoding it.
+    """
     # Determine if we should show output based on verbosity settings
     if show_output is None:
         show_output = VERBOSE
@@ -207,31 +499,104 @@ def run_command(
 
     try:
         return subprocess.run(
-            cmd, check=check, capture_output=capture_output, text=True, **kwargs
+            cmd, check=check, capture_output=capture_output, text=text, **kwargs
         )
     except subprocess.CalledProcessError as e:
         if capture_output:
             if not QUIET:
                 console.print(f"{Icons.ERROR} Command failed: {' '.join(cmd)}")
             if e.stdout and (VERBOSE or DEBUG):
-                console.print(f"[yellow]stdout:[/yellow] {e.stdout}")
+                console.print(f"[yellow]stdout:[/yellow] {decode_output(e.stdout)}")
             if e.stderr:
-                console.print(f"[red]stderr:[/red] {e.stderr}")
+                console.print(f"[red]stderr:[/red] {decode_output(e.stderr)}")
         raise ReleaseError(f"Command failed: {' '.join(cmd)}") from e
 
 
+@cache
 def get_notarytool_path() -> str:
     """Get the path to notarytool from Xcode developer directory"""
     try:
-        result = run_command(["xcode-select", "-p"], capture_output=True)
+        result = run_command(["xcode-select", "-p"], capture_output=True, text=True)
         developer_dir = result.stdout.strip()
         return os.path.join(developer_dir, "usr", "bin", "notarytool")
     except Exception:
         return "notarytool"  # Fallback to PATH
 
 
+def extend_keychain_timeout() -> None:
+    """Raise the default keychain's auto-lock timeout for the rest of the release.
+
+    The previous settings are put back by restore_keychain_settings. Failing to
+    read or change them only warns, since the keychain is unlocked either way.
+    """
+    global KEYCHAIN_SETTINGS_TO_RESTORE
+
+    result = run_command(
+        ["security", "show-keychain-info"], check=False, show_output=False, text=True
+    )
+    if result.returncode != 0:
+        if not QUIET:
+            console.print(
+                f"{Icons.WARNING} Could not read keychain settings, it may lock before Sparkle signing"
+            )
+        return
+
+    # Keychains that never auto-lock, or not before the release is done, are
+    # left alone
+    info = result.stdout + result.stderr
+    timeout_match = KEYCHAIN_TIMEOUT_RE.search(info)
+    if timeout_match is None or int(timeout_match.group(1)) >= KEYCHAIN_UNLOCK_SECONDS:
+        return
+
+    # Without -l and -u, set-keychain-settings turns lock-on-sleep and
+    # lock-after-timeout off, so carry over the lock-on-sleep flag
+    lock_on_sleep = ["-l"] if "lock-on-sleep" in info else []
+    result = run_command(
+        [
+            "security",
+            "set-keychain-settings",
+            *lock_on_sleep,
+            "-u",
+            "-t",
+            str(KEYCHAIN_UNLOCK_SECONDS),
+        ],
+        check=False,
+        show_output=False,
+    )
+    if result.returncode != 0:
+        if not QUIET:
+            console.print(
+                f"{Icons.WARNING} Could not extend the keychain timeout, it may lock before Sparkle signing"
+            )
+        return
+
+    KEYCHAIN_SETTINGS_TO_RESTORE = [*lock_on_sleep, "-u", "-t", timeout_match.group(1)]
+
+
+def restore_keychain_settings() -> None:
+    """Put back the default keychain's auto-lock settings changed by
+    extend_keychain_timeout, if any
+    """
+    global KEYCHAIN_SETTINGS_TO_RESTORE
+
+    if KEYCHAIN_SETTINGS_TO_RESTORE is None:
+        return
+
+    result = run_command(
+        ["security", "set-keychain-settings", *KEYCHAIN_SETTINGS_TO_RESTORE],
+        check=False,
+        show_output=False,
+    )
+    if result.returncode != 0:
+        console.print(
+            f"{Icons.WARNING} Could not restore the keychain's auto-lock settings, "
+            "check them in Keychain Access"
+        )
+    KEYCHAIN_SETTINGS_TO_RESTORE = None
+
+
 def unlock_keychain() -> bool:
-    """Interactively unlock the keychain"""
+    """Interactively unlock the keychain and keep it unlocked for the release"""
     console.print("\n[yellow]Keychain Access Required[/yellow]")
     console.print("The script needs to access your keychain for:")
     console.print("  • Code signing with Developer ID certificate")
@@ -249,6 +614,7 @@ def unlock_keychain() -> bool:
             console.print("[red]Failed to unlock keychain[/red]")
             return False
 
+        extend_keychain_timeout()
         console.print("[green]✓[/green] Keychain unlocked successfully")
         return True
 
@@ -257,6 +623,81 @@ def unlock_keychain() -> bool:
         return False
 
 
+@cache
+def unlock_signing_keychain() -> None:
+    """Unlock the signing keychain once per run if KEYCHAIN_PASSWORD is set.
+
+    Also sets the keychain to auto-lock after an hour of inactivity (and on
+    sleep), so it stays unlocked for the rest of the release instead of
+    prompting during codesign.
+    """
+    password = os.environ.get("KEYCHAIN_PASSWORD")
+    if not password:
+        return
+
+    keychain = os.environ.get("KEYCHAIN_PATH")
+    keychain_args = [keychain] if keychain else []
+
+    # Not using run_command so the password never appears in error output
+    result = subprocess.run(
+        ["security", "unlock-keychain", "-p", password, *keychain_args],
+        capture_output=True,
+        check=False,
+    )
+    if result.returncode != 0:
+        raise ReleaseError(
+            f"Failed to unlock signing keychain: {decode_output(result.stderr).strip()}"
+        )
+
+    # Without -u, -t alone would turn auto-lock off instead of setting it
+    run_command(
+        [
+            "security",
+            "set-keychain-settings",
+            "-l",
+            "-u",
+            "-t",
+            str(KEYCHAIN_UNLOCK_SECONDS),
+            *keychain_args,
+        ],
+        show_output=False,
+    )
+
+
+@cache
+def find_tool(name: str) -> Optional[str]:
+    """Look up an optional command on PATH, at most once per run"""
+    return shutil.which(name)
+
+
+def find_executables(names: Any) -> Set[str]:
+    """Return which of the given command names are executables on PATH.
+
+    Lists each PATH directory once instead of stat-ing every directory for every
+    name the way repeated shutil.which calls would.
+    """
+    wanted = set(names)
+    found: Set[str] = set()
+
+    for directory in os.environ.get("PATH", os.defpath).split(os.pathsep):
+        try:
+            with os.scandir(directory or os.curdir) as entries:
+                for entry in entries:
+                    if (
+                        entry.name in wanted
+                        and entry.name not in found
+                        and entry.is_file()
+                        and os.access(entry.path, os.X_OK)
+                    ):
+                        found.add(entry.name)
+        except OSError:
+            continue
+        if found == wanted:
+            break
+
+    return found
+
+
 def validate_tools() -> None:
     """Validate that all required tools are installed"""
     tools = {
@@ -269,13 +710,19 @@ def validate_tools() -> None:
 
     missing_tools = []
 
-    # Check each tool without progress display (to avoid nested Progress contexts)
-    for tool, description in tools.items():
-        if shutil.which(tool) is None:
-            missing_tools.append(f"{tool} ({description})")
+    # Scan PATH while xcode-select looks up the Xcode developer directory
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        notarytool_future = executor.submit(get_notarytool_path)
+        found_tools = find_executables(tools)
+
+        # Check each tool without progress display (to avoid nested Progress contexts)
+        for tool, description in tools.items():
+            if tool not in found_tools:
+                missing_tools.append(f"{tool} ({description})")
+
+        notarytool_path = notarytool_future.result()
 
     # Check for notarytool in Xcode developer directory
-    notarytool_path = get_notarytool_path()
     if not os.path.exists(notarytool_path):
         missing_tools.append(
             f"notarytool (Apple notarization tool at {notarytool_path})"
@@ -297,13 +744,13 @@ def validate_tools() -> None:
     # Success message will be printed by run_parallel_tasks
 
 
-def show_pre_release_checklist(warnings: List[str]) -> bool:
+def show_pre_release_checklist(warnings: List[str], warning_tags: Set[str]) -> bool:
     """Show an interactive pre-release checklist"""
     if QUIET:
         return True
 
     console.print()
-    console.rule("[bold blue]Pre-Release Checklist[/bold blue]")
+    console.rule(section_title("Pre-Release Checklist"))
 
     # Create a table for the checklist
     table = Table(show_header=False, box=None, padding=(0, 2))
@@ -311,7 +758,7 @@ def show_pre_release_checklist(warnings: List[str]) -> bool:
     table.add_column("Item")
 
     # Check git status
-    git_clean = not any("uncommitted changes" in w for w in warnings)
+    git_clean = "uncommitted" not in warning_tags
     table.add_row(
         Icons.SUCCESS if git_clean else Icons.WARNING,
         "Working directory clean"
@@ -320,21 +767,21 @@ def show_pre_release_checklist(warnings: List[str]) -> bool:
     )
 
     # Check branch
-    on_main = not any("Not on main branch" in w for w in warnings)
+    on_main = "not_on_main" not in warning_tags
     table.add_row(
         Icons.SUCCESS if on_main else Icons.WARNING,
         "On main branch" if on_main else "Not on main branch",
     )
 
     # Check if up to date
-    up_to_date = not any("behind origin/main" in w for w in warnings)
+    up_to_date = "behind_remote" not in warning_tags
     table.add_row(
         Icons.SUCCESS if up_to_date else Icons.WARNING,
         "Up to date with remote" if up_to_date else "Local branch is behind remote",
     )
 
     # Check changelog
-    changelog_ready = not any("Unreleased" in w for w in warnings)
+    changelog_ready = "changelog_not_ready" not in warning_tags
     table.add_row(
         Icons.SUCCESS if changelog_ready else Icons.WARNING,
         "Changelog has unreleased content"
@@ -343,7 +790,7 @@ def show_pre_release_checklist(warnings: List[str]) -> bool:
     )
 
     # Check disk space
-    disk_ok = not any("Low disk space" in w for w in warnings)
+    disk_ok = "low_disk" not in warning_tags
     table.add_row(
         Icons.SUCCESS if disk_ok else Icons.WARNING,
         "Sufficient disk space" if disk_ok else "Low disk space",
@@ -360,47 +807,78 @@ def show_pre_release_checklist(warnings: List[str]) -> bool:
         return Confirm.ask("[green]Ready to proceed?[/green]", default=True)
 
 
-def preflight_checks() -> List[str]:
-    """Run pre-flight checks and return warnings"""
+def fetch_is_recent(max_age: float = FETCH_MAX_AGE) -> bool:
+    """Check whether the remote was fetched within the last `max_age` seconds"""
+    try:
+        return time.time() - Path(".git/FETCH_HEAD").stat().st_mtime < max_age
+    except OSError:
+        return False
+
+
+def preflight_checks(
+    fetch: bool = True,
+) -> Tuple[List[str], Set[str], Optional[ChangelogState]]:
+    """Run pre-flight checks and return warnings along with tags identifying them,
+    and the parsed changelog for later steps to reuse"""
     warnings = []
+    warning_tags = set()
+
+    def fetch_and_count_behind() -> subprocess.CompletedProcess[str]:
+        # A fetch from the last few minutes is still good enough to compare against
+        if fetch and not fetch_is_recent():
+            run_command(["git", "fetch"], check=False)
+        return run_command(
+            ["git", "rev-list", "HEAD..origin/main", "--count"], check=False, text=True
+        )
+
+    # The git commands are independent of each other (apart from the fetch
+    # that must precede rev-list), so run them concurrently
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        status_future = executor.submit(
+            run_command, ["git", "status", "--porcelain"], check=False, text=True
+        )
+        branch_future = executor.submit(
+            run_command, ["git", "branch", "--show-current"], text=True
+        )
+        behind_future = executor.submit(fetch_and_count_behind)
+
+        status_result = status_future.result()
+        branch_result = branch_future.result()
+        behind_result = behind_future.result()
 
     # Check git status
-    result = run_command(["git", "status", "--porcelain"], check=False)
-    if result.stdout.strip():
-        uncommitted_files = result.stdout.strip().split("\n")
+    if status_result.stdout.strip():
+        uncommitted_files = status_result.stdout.strip().split("\n")
         warnings.append(
             f"Working directory has {len(uncommitted_files)} uncommitted changes"
         )
+        warning_tags.add("uncommitted")
 
     # Check if on main branch
-    result = run_command(["git", "branch", "--show-current"])
-    current_branch = result.stdout.strip()
+    current_branch = branch_result.stdout.strip()
     if current_branch != "main":
         warnings.append(f"Not on main branch (currently on '{current_branch}')")
+        warning_tags.add("not_on_main")
 
     # Check if up to date with remote
-    run_command(["git", "fetch"], check=False)
-    result = run_command(
-        ["git", "rev-list", "HEAD..origin/main", "--count"], check=False
-    )
-    if result.stdout.strip() != "0":
+    if behind_result.stdout.strip() != "0":
         warnings.append("Local branch is behind origin/main")
+        warning_tags.add("behind_remote")
 
     # Check if changelog has unreleased content
     changelog_path = Path("CHANGELOG.md")
+    changelog_state = None
     if changelog_path.exists():
-        content = changelog_path.read_text()
-        if "## Unreleased" not in content:
+        changelog_state = ChangelogState.read(changelog_path)
+        if "## Unreleased" not in changelog_state.content:
             warnings.append("No '## Unreleased' section in CHANGELOG.md")
+            warning_tags.add("changelog_not_ready")
         else:
             # Check if unreleased section has content
-            import re
-
-            unreleased_match = re.search(
-                r"## Unreleased\n(.*?)(?=\n## |$)", content, re.DOTALL
-            )
-            if unreleased_match and not unreleased_match.group(1).strip():
+            unreleased_match = changelog_state.unreleased_match
+            if unreleased_match and not unreleased_match.group(2).strip():
                 warnings.append("'## Unreleased' section in CHANGELOG.md is empty")
+                warning_tags.add("changelog_not_ready")
     else:
         warnings.append("CHANGELOG.md not found")
 
@@ -409,48 +887,59 @@ def preflight_checks() -> List[str]:
         warnings.append("appcast.xml not found")
 
     # Check disk space
-    import shutil
-
     stat = shutil.disk_usage(".")
     free_gb = stat.free / (1024**3)
     if free_gb < 5:
         warnings.append(
             f"Low disk space: {free_gb:.1f} GB free (recommend at least 5 GB)"
         )
+        warning_tags.add("low_disk")
 
-    return warnings
+    return warnings, warning_tags, changelog_state
 
 
 def run_parallel_tasks(
     tasks: List[Tuple[str, Any, tuple]], description: str = "Running tasks"
 ) -> List[Any]:
-    """Run multiple tasks sequentially (parallelization removed) and return their results"""
-    results = []
-
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        console=console,
-    ) as progress:
+    """Run multiple tasks concurrently and return their results in task order.
+
+    Each task is a (name, func, args) tuple.
+    """
+    results: List[Any] = [None] * len(tasks)
+    errors: List[Exception] = []
+
+    with maybe_progress() as progress:
         task = progress.add_task(description, total=len(tasks))
 
-        for task_name, func, args in tasks:
+        def finish(index: int, task_name: str, get_result: Callable[[], Any]) -> None:
             try:
-                # Run task sequentially
-                result = func(*args)
-                results.append(result)
+                results[index] = get_result()
                 console.print(f"[green]✓[/green] {task_name}")
             except Exception as e:
                 console.print(f"[red]✗[/red] {task_name}: {e}")
-                raise
+                errors.append(e)
             finally:
                 progress.advance(task)
 
+        with ThreadPoolExecutor(max_workers=max(1, min(8, len(tasks)))) as executor:
+            futures = {
+                executor.submit(func, *args): (index, task_name)
+                for index, (task_name, func, args) in enumerate(tasks)
+            }
+
+            for future in as_completed(futures):
+                finish(*futures[future], future.result)
+
+    # Re-raise the first failure once every task has reported its status
+    if errors:
+        raise errors[0]
+
     return results
 
 
-def validate_environment() -> Dict[str, str]:
-    """Validate all required environment variables"""
+@cache
+def _compute_environment() -> Tuple[Dict[str, str], Tuple[str, ...]]:
+    """Collect the release environment variables and describe any missing ones"""
     required_vars = {"APPLE_TEAM_ID": "Apple Team ID for code signing"}
 
     optional_vars = {
@@ -478,13 +967,21 @@ def validate_environment() -> Dict[str, str]:
         if value:
             env_vars[var] = value
 
+    return env_vars, tuple(missing)
+
+
+def validate_environment() -> Dict[str, str]:
+    """Validate all required environment variables"""
+    env_vars, missing = _compute_environment()
+
     if missing:
         console.print("[red]Missing required environment variables:[/red]")
         for var in missing:
             console.print(f"  • {var}")
         raise ReleaseError("Please set required environment variables")
 
-    return env_vars
+    # Hand out a copy so callers can't modify the cached result
+    return dict(env_vars)
 
 
 def parse_arguments() -> argparse.Namespace:
@@ -495,6 +992,8 @@ def parse_arguments() -> argparse.Namespace:
 Environment Variables:
     APPLE_TEAM_ID: Apple App Store Connect Team ID (required)
     APPLE_KEYCHAIN_PROFILE: Keychain profile name (overrides config file)
+    KEYCHAIN_PASSWORD: Password for unlocking the signing keychain (optional)
+    KEYCHAIN_PATH: Signing keychain path (defaults to the default keychain)
         """,
     )
     parser.add_argument(
@@ -521,6 +1020,11 @@ Environment Variables:
         action="store_true",
         help="Skip Sparkle update signing and appcast update (useful if EdDSA key is not accessible)",
     )
+    parser.add_argument(
+        "--no-fetch",
+        action="store_true",
+        help="Don't fetch from the remote before checking whether the branch is up to date",
+    )
     parser.add_argument(
         "--verbose", "-v", action="store_true", help="Show detailed command output"
     )
@@ -543,48 +1047,6 @@ Environment Variables:
     return args
 
 
-def get_current_versions(project_path: Path, bundle_identifier: str) -> Tuple[int, str]:
-    """Extract current version numbers from Xcode project for the specified bundle identifier"""
-    with open(project_path, "r") as f:
-        content = f.read()
-
-    # Find all buildSettings sections
-    build_settings_pattern = r"buildSettings\s*=\s*\{([^}]+)\};"
-
-    current_version = None
-    marketing_version = None
-
-    for match in re.finditer(build_settings_pattern, content, re.DOTALL):
-        settings_block = match.group(1)
-
-        # Check if this block contains our bundle identifier
-        if f"PRODUCT_BUNDLE_IDENTIFIER = {bundle_identifier};" in settings_block:
-            # Extract CURRENT_PROJECT_VERSION from this block
-            current_match = re.search(
-                r"CURRENT_PROJECT_VERSION = (\d+);", settings_block
-            )
-            if current_match:
-                current_version = int(current_match.group(1))
-
-            # Extract MARKETING_VERSION from this block
-            marketing_match = re.search(
-                r"MARKETING_VERSION = ([\d.]+);", settings_block
-            )
-            if marketing_match:
-                marketing_version = marketing_match.group(1)
-
-            # We found a valid buildSettings block, we can use these values
-            if current_version is not None and marketing_version is not None:
-                break
-
-    if current_version is None or marketing_version is None:
-        raise ReleaseError(
-            f"Could not find version numbers for bundle identifier {bundle_identifier}"
-        )
-
-    return current_version, marketing_version
-
-
 def show_version_table(
     current_marketing: str,
     current_project: int,
@@ -623,8 +1085,7 @@ def show_version_table(
 
 def validate_version(version: str) -> bool:
     """Validate semantic version format (X.Y.Z)"""
-    pattern = r"^\d+\.\d+\.\d+$"
-    return bool(re.match(pattern, version))
+    return bool(SEMVER_RE.match(version))
 
 
 def increment_versions(
@@ -660,76 +1121,79 @@ def increment_versions(
     return new_project, new_marketing
 
 
-def update_project_versions(
+def read_and_update_versions(
     project_path: Path,
     bundle_identifier: str,
-    new_project: int,
-    new_marketing: str,
+    version_type: str,
     rollback_manager: RollbackManager,
-) -> None:
-    """Update version numbers in Xcode project file for the specified bundle identifier"""
-    # Backup the file before modifying
-    rollback_manager.backup_file(project_path)
-
-    with open(project_path, "r") as f:
-        content = f.read()
-
-    # We need to update version numbers only in buildSettings blocks that contain our bundle identifier
-    # Use a more complex approach to handle nested braces correctly
-
-    def find_matching_brace(text: str, start_pos: int) -> int:
-        """Find the closing brace for an opening brace at start_pos"""
-        count = 1
-        pos = start_pos + 1
-        while pos < len(text) and count > 0:
-            if text[pos] == "{":
-                count += 1
-            elif text[pos] == "}":
-                count -= 1
-            pos += 1
-        return pos - 1 if count == 0 else -1
-
-    modified_content = content
-    offset = 0
-
-    # Find all buildSettings blocks
-    for match in re.finditer(r"buildSettings\s*=\s*\{", content):
-        start = match.end() - 1  # Position of the opening brace
-        end = find_matching_brace(content, start)
-
-        if end == -1:
-            continue
+) -> Tuple[int, str, int, str]:
+    """Read the version numbers for the specified bundle identifier from the Xcode
+    project, increment them and write them back in a single pass over the file.
 
-        settings_block = content[start + 1 : end]
+    Returns (current_project, current_marketing, new_project, new_marketing).
+    """
+    content = project_path.read_text(encoding="utf-8")
 
-        # Check if this block contains our bundle identifier
-        if f"PRODUCT_BUNDLE_IDENTIFIER = {bundle_identifier};" in settings_block:
-            # Update CURRENT_PROJECT_VERSION in this block
-            updated_block = re.sub(
-                r"CURRENT_PROJECT_VERSION = \d+;",
-                f"CURRENT_PROJECT_VERSION = {new_project};",
-                settings_block,
-            )
+    all_blocks = list(BUILD_SETTINGS_RE.finditer(content))
+    if len(all_blocks) != len(BUILD_SETTINGS_START_RE.findall(content)):
+        # Skipping a block could leave some of our build configurations on
+        # the old version, so refuse to update any of them
+        raise ReleaseError(
+            f"Could not parse every buildSettings block in {project_path}"
+            " (nested braces are not supported)"
+        )
 
-            # Update MARKETING_VERSION in this block
-            updated_block = re.sub(
-                r"MARKETING_VERSION = [\d.]+;",
-                f"MARKETING_VERSION = {new_marketing};",
-                updated_block,
-            )
+    bundle_setting = f"PRODUCT_BUNDLE_IDENTIFIER = {bundle_identifier};"
+    blocks = [match for match in all_blocks if bundle_setting in match.group(1)]
+
+    # Use the first block for our bundle identifier that has both version numbers
+    current_project = None
+    current_marketing = None
+    for match in blocks:
+        current_match = CURRENT_VERSION_RE.search(match.group(1))
+        marketing_match = MARKETING_VERSION_RE.search(match.group(1))
+        if current_match:
+            current_project = int(current_match.group(1))
+        if marketing_match:
+            current_marketing = marketing_match.group(1)
+        if current_project is not None and current_marketing is not None:
+            break
 
-            # Replace the block in the content
-            modified_content = (
-                modified_content[: start + 1 + offset]
-                + updated_block
-                + modified_content[end + offset :]
-            )
+    if current_project is None or current_marketing is None:
+        raise ReleaseError(
+            f"Could not find version numbers for bundle identifier {bundle_identifier}"
+        )
+
+    new_project, new_marketing = increment_versions(
+        current_project, current_marketing, version_type
+    )
 
-            # Update offset for subsequent replacements
-            offset += len(updated_block) - len(settings_block)
+    # Nothing to write when keeping the existing versions
+    if version_type == "skip":
+        return current_project, current_marketing, new_project, new_marketing
+
+    # Backup the file before modifying
+    rollback_manager.backup_file(project_path, content)
 
-    with open(project_path, "w") as f:
-        f.write(modified_content)
+    current_version_setting = f"CURRENT_PROJECT_VERSION = {new_project};"
+    marketing_version_setting = f"MARKETING_VERSION = {new_marketing};"
+
+    # Update version numbers only in buildSettings blocks that contain our bundle
+    # identifier, splicing the updated blocks between the untouched text
+    parts = []
+    last_end = 0
+    for match in blocks:
+        settings_block = match.group(1)
+        updated_block = CURRENT_VERSION_RE.sub(current_version_setting, settings_block)
+        updated_block = MARKETING_VERSION_RE.sub(marketing_version_setting, updated_block)
+        parts.append(content[last_end : match.start(1)])
+        parts.append(updated_block)
+        last_end = match.end(1)
+    parts.append(content[last_end:])
+
+    project_path.write_text("".join(parts), encoding="utf-8")
+
+    return current_project, current_marketing, new_project, new_marketing
 
 
 def show_release_notes_preview(changelog_items: str, version: str) -> None:
@@ -743,7 +1207,7 @@ def show_release_notes_preview(changelog_items: str, version: str) -> None:
     # Create a panel with syntax highlighting for markdown
     preview_panel = Panel(
         Syntax(changelog_items, "markdown", theme="monokai", line_numbers=False),
-        title="[bold]Changelog Items[/bold]",
+        title=CHANGELOG_ITEMS_TITLE,
         border_style="blue",
         padding=(1, 2),
     )
@@ -757,7 +1221,8 @@ def get_last_release_tag() -> Optional[str]:
     try:
         result = run_command(
             ["git", "tag", "-l", "v*.*.*", "--sort=-version:refname"],
-            show_output=False
+            show_output=False,
+            text=True,
         )
         tags = result.stdout.strip().split('\n')
         if tags and tags[0]:
@@ -774,7 +1239,7 @@ def get_commits_since_tag(tag: Optional[str]) -> List[Dict[str, str]]:
     if tag:
         cmd_full.append(f"{tag}..HEAD")
     
-    result = run_command(cmd_full, show_output=False)
+    result = run_command(cmd_full, show_output=False, text=True)
     commits = []
     
     # Split by our delimiter to separate commits
@@ -810,12 +1275,22 @@ def format_changelog_entry(commit: Dict[str, str]) -> str:
     return f"* {commit['message']} ([{commit['short_sha']}]({github_url}))"
 
 
-def update_changelog_with_commits(rollback_manager: RollbackManager) -> bool:
-    """Offer to update changelog with commits since last release"""
+def update_changelog_with_commits(
+    rollback_manager: RollbackManager,
+    changelog_state: Optional[ChangelogState] = None,
+) -> Optional[ChangelogState]:
+    """Offer to update changelog with commits since last release.
+
+    Returns the changelog as it stands afterwards, or None if there is none.
+    """
     changelog_path = Path("CHANGELOG.md")
     
-    if not changelog_path.exists():
-        return False
+    if changelog_state is None:
+        if not changelog_path.exists():
+            return None
+        changelog_state = ChangelogState.read(changelog_path)
+    else:
+        changelog_state = changelog_state.refreshed()
     
     # Get commits since last release
     last_tag = get_last_release_tag()
@@ -824,7 +1299,7 @@ def update_changelog_with_commits(rollback_manager: RollbackManager) -> bool:
     if not commits:
         if not QUIET:
             console.print(f"{Icons.INFO} No new commits found since last release")
-        return False
+        return changelog_state
     
     # Format the commits as changelog entries
     new_entries = [format_changelog_entry(commit) for commit in commits]
@@ -832,12 +1307,12 @@ def update_changelog_with_commits(rollback_manager: RollbackManager) -> bool:
     # Show preview of new entries
     if not QUIET:
         console.print()
-        console.rule("[bold blue]Suggested Changelog Entries[/bold blue]")
+        console.rule(section_title("Suggested Changelog Entries"))
         console.print(f"\nFound {len(commits)} new commits since {last_tag or 'beginning'}:\n")
         
         preview_panel = Panel(
             '\n'.join(new_entries),
-            title="[bold]New Changelog Entries[/bold]",
+            title=NEW_CHANGELOG_ENTRIES_TITLE,
             border_style="blue",
             padding=(1, 2),
         )
@@ -845,20 +1320,20 @@ def update_changelog_with_commits(rollback_manager: RollbackManager) -> bool:
         console.print()
         
         if not Confirm.ask("[yellow]Add these entries to the changelog?[/yellow]", default=True):
-            return False
-    
-    # Backup the changelog before modifying
-    rollback_manager.backup_file(changelog_path)
+            return changelog_state
     
-    # Read the current changelog
-    with open(changelog_path, "r") as f:
-        content = f.read()
+    # The changelog may have been edited while the entries were being reviewed
+    changelog_state = changelog_state.refreshed()
+    content = changelog_state.content
     
     # Find the Unreleased section
-    unreleased_match = re.search(r"(## Unreleased\n)(.*?)(?=\n## |$)", content, re.DOTALL)
+    unreleased_match = changelog_state.unreleased_match
     if not unreleased_match:
         console.print(f"{Icons.ERROR} Could not find '## Unreleased' section in CHANGELOG.md")
-        return False
+        return changelog_state
+    
+    # Backup the changelog before modifying
+    rollback_manager.backup_file(changelog_path, content)
     
     unreleased_header = unreleased_match.group(1)
     existing_content = unreleased_match.group(2).strip()
@@ -876,69 +1351,148 @@ def update_changelog_with_commits(rollback_manager: RollbackManager) -> bool:
     )
     
     # Write the updated changelog
-    with open(changelog_path, "w") as f:
-        f.write(updated_content)
+    changelog_path.write_text(updated_content, encoding="utf-8")
     
     if not QUIET:
         console.print(f"{Icons.SUCCESS} Updated CHANGELOG.md with {len(commits)} new entries")
     
-    return True
+    return ChangelogState(
+        changelog_path,
+        updated_content,
+        changelog_path.stat().st_mtime_ns,
+        UNRELEASED_RE.search(updated_content),
+    )
 
 
 def process_changelog(
-    new_project: int, new_marketing: str, rollback_manager: RollbackManager
+    new_project: int,
+    new_marketing: str,
+    rollback_manager: RollbackManager,
+    changelog_state: Optional[ChangelogState] = None,
 ) -> str:
     """Process CHANGELOG.md and generate release notes HTML"""
     changelog_path = Path("CHANGELOG.md")
 
-    # Backup CHANGELOG.md before modifying
-    rollback_manager.backup_file(changelog_path)
+    # Reuse the changelog read earlier in the release unless it changed since
+    if changelog_state is None:
+        changelog_state = ChangelogState.read(changelog_path)
+    else:
+        changelog_state = changelog_state.refreshed()
+    content = changelog_state.content
 
-    with open(changelog_path, "r") as f:
-        content = f.read()
+    # Backup CHANGELOG.md before modifying
+    rollback_manager.backup_file(changelog_path, content)
 
     # Find the Unreleased section
-    unreleased_match = re.search(r"## Unreleased\n(.*?)(?=\n## |$)", content, re.DOTALL)
+    unreleased_match = changelog_state.unreleased_match
     if not unreleased_match:
         raise ReleaseError("Could not find '## Unreleased' section in CHANGELOG.md")
 
-    changelog_items = unreleased_match.group(1).strip()
+    changelog_items = unreleased_match.group(2).strip()
 
-    # Update CHANGELOG.md
+    # Rename the Unreleased section to the new version, with a new empty
+    # Unreleased section above it
     new_header = f"## Version {new_marketing} ({new_project})"
-    updated_content = content.replace("## Unreleased", new_header, 1)
-
-    # Add new Unreleased section at the top
-    lines = updated_content.split("\n")
-    for i, line in enumerate(lines):
-        if line.strip() == new_header:
-            lines.insert(i, "## Unreleased")
-            lines.insert(i + 1, "")
-            break
-
-    updated_content = "\n".join(lines)
+    updated_content = content.replace(
+        "## Unreleased", f"## Unreleased\n\n{new_header}", 1
+    )
 
-    with open(changelog_path, "w") as f:
-        f.write(updated_content)
+    changelog_path.write_text(updated_content, encoding="utf-8")
 
     # Don't generate HTML file anymore - we'll embed it directly in appcast.xml
     return changelog_items
 
 
-def generate_html_from_markdown(markdown_text: str, version: Optional[str] = None) -> str:
-    """Convert markdown changelog to HTML using markdown2"""
-    # Convert markdown to HTML with useful extras
-    html_content = markdown2.markdown(
+def _escape_underscore_run(match: re.Match) -> str:
+    """Escape a run of underscores unless it sits inside a word, where cmark-gfm
+    never treats underscores as emphasis
+    """
+    underscores = match.group(3)
+    if underscores is None:
+        return match.group(1)
+
+    text = match.string
+    before = text[match.start() - 1 : match.start()]
+    after = text[match.end() : match.end() + 1]
+    if before.isalnum() and after.isalnum():
+        return underscores
+    return "\\_" * len(underscores)
+
+
+def escape_underscore_emphasis(markdown_text: str) -> str:
+    r"""Escape the underscores cmark-gfm could read as emphasis, so that names
+    like __init__ stay literal as with markdown2's code-friendly extra.
+
+    Code blocks, code spans, raw HTML and autolinks are left untouched, since
+    cmark-gfm would render a backslash there verbatim. Indented lines are left
+    alone too, as they may be code blocks.
+
+    >>> escape_underscore_emphasis("Fix __init__ and _private in snake_case_names")
+    'Fix \\_\\_init\\_\\_ and \\_private in snake_case_names'
+    >>> escape_underscore_emphasis("`__init__`, ``a_b_``, \\_x and www.example.com/foo_bar_")
+    '`__init__`, ``a_b_``, \\_x and www.example.com/foo_bar_'
+    >>> escape_underscore_emphasis("<https://x.io/_a_> or _first_last_@example.com")
+    '<https://x.io/_a_> or _first_last_@example.com'
+    >>> escape_underscore_emphasis("~~~\n_x_\n~~~\n\n    indented_code_block_\n")
+    '~~~\n_x_\n~~~\n\n    indented_code_block_\n'
+    >>> escape_underscore_emphasis('<div>\n_x_\n</div>\n\n<span class="a_b">_y_</span>')
+    '<div>\n_x_\n</div>\n\n<span class="a_b">\\_y\\_</span>'
+    """
+    parts: List[str] = []
+    paragraph: List[str] = []
+    fence: Optional[str] = None
+    in_html_block = False
+
+    def flush_paragraph() -> None:
+        parts.append(MARKDOWN_INLINE_RE.sub(_escape_underscore_run, "".join(paragraph)))
+        paragraph.clear()
+
+    for line in markdown_text.splitlines(keepends=True):
+        if fence is not None:
+            # Inside a fenced code block, which a fence of at least the same
+            # length made of the same character closes
+            parts.append(line)
+            closing = line.strip()
+            if closing.startswith(fence) and closing == fence[0] * len(closing):
+                fence = None
+            continue
+
+        if in_html_block:
+            # HTML blocks run until the next blank line
+            parts.append(line)
+            in_html_block = bool(line.strip())
+            continue
+
+        fence_match = MARKDOWN_FENCE_RE.match(line)
+        if fence_match:
+            fence = fence_match.group(1)
+        elif MARKDOWN_HTML_BLOCK_RE.match(line):
+            in_html_block = True
+        elif not line.startswith(("    ", "\t")):
+            paragraph.append(line)
+            continue
+
+        flush_paragraph()
+        parts.append(line)
+
+    flush_paragraph()
+    return "".join(parts)
+
+
+def markdown_to_html(markdown_text: str) -> str:
+    """Render GitHub-flavored markdown to HTML with links opening in a new window"""
+    markdown_text = escape_underscore_emphasis(markdown_text)
+    html_content = cmarkgfm.markdown_to_html_with_extensions(
         markdown_text,
-        extras=[
-            "fenced-code-blocks",
-            "tables",
-            "strike",
-            "target-blank-links",
-            "task_list",
-            "code-friendly",
-        ],
+        options=CmarkOptions.CMARK_OPT_UNSAFE,
+        extensions=["table", "strikethrough", "tasklist", "autolink"],
     )
+    return LINK_TAG_RE.sub('<a target="_blank" rel="noopener" href=', html_content)
+
+
+def generate_html_from_markdown(markdown_text: str, version: Optional[str] = None) -> str:
+    """Convert markdown changelog to HTML"""
+    html_content = markdown_to_html(markdown_text)
 
     # Determine title
     title = f"Release Notes - Version {version}" if version else "Release Notes"
@@ -976,8 +1530,7 @@ VALID_ARCHS = x86_64 arm64
 """
 
     xcconfig_path = archive_dir / "release_signing.xcconfig"
-    with open(xcconfig_path, "w") as f:
-        f.write(xcconfig_content)
+    xcconfig_path.write_text(xcconfig_content, encoding="utf-8")
 
     return xcconfig_path
 
@@ -992,11 +1545,7 @@ def build_xcode_archive(
     if not team_id:
         raise ReleaseError("APPLE_TEAM_ID environment variable is not set")
 
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        console=console,
-    ) as progress:
+    with maybe_progress() as progress:
         # Create xcconfig file for code signing
         task = progress.add_task("Creating signing configuration...", total=None)
         xcconfig_path = create_signing_xcconfig(archive_dir, team_id)
@@ -1032,33 +1581,36 @@ def build_xcode_archive(
             console.print(
                 f"[dim]Running: {' '.join(xcodebuild_cmd)} | xcbeautify[/dim]"
             )
-        xcodebuild_proc = subprocess.Popen(
-            xcodebuild_cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True
-        )
-        xcbeautify_proc = subprocess.Popen(
-            ["xcbeautify"],
-            stdin=xcodebuild_proc.stdout,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True,
-        )
 
-        # Close xcodebuild's stdout in parent process
-        if xcodebuild_proc.stdout:
-            xcodebuild_proc.stdout.close()
+        # Stream the build output straight to its destination instead of
+        # buffering it in this process: the terminal when verbose, otherwise a
+        # log file in the archive directory that is shown on failure
+        build_log_path = archive_dir / "xcodebuild.log"
+        with open(build_log_path, "wb") as build_log:
+            xcodebuild_proc = subprocess.Popen(
+                xcodebuild_cmd, stdout=subprocess.PIPE, stderr=build_log
+            )
+            xcbeautify_proc = subprocess.Popen(
+                ["xcbeautify"],
+                stdin=xcodebuild_proc.stdout,
+                stdout=None if VERBOSE else build_log,
+                stderr=build_log,
+            )
 
-        # Get output from xcbeautify
-        stdout, stderr = xcbeautify_proc.communicate()
+            # Close xcodebuild's stdout in parent process
+            if xcodebuild_proc.stdout:
+                xcodebuild_proc.stdout.close()
 
-        # Wait for xcodebuild to finish
-        xcodebuild_proc.wait()
+            xcbeautify_proc.wait()
+            xcodebuild_proc.wait()
 
         # Check for errors
         if xcodebuild_proc.returncode != 0 or xcbeautify_proc.returncode != 0:
-            if stdout:
-                console.print(f"[yellow]stdout:[/yellow] {stdout}")
-            if stderr:
-                console.print(f"[red]stderr:[/red] {stderr}")
+            log_tail = read_log_tail(build_log_path)
+            if log_tail:
+                console.print("[red]Build output (last lines):[/red]")
+                console.print(log_tail, markup=False, highlight=False)
+            console.print(f"[dim]Full build log: {build_log_path}[/dim]")
             raise ReleaseError("Build archive failed")
 
         # Export archive
@@ -1067,34 +1619,23 @@ def build_xcode_archive(
 
         # Don't track export directory for rollback - we want to keep it
 
-        # Create export options plist
-        export_options = f"""<?xml version="1.0" encoding="UTF-8"?>
-<!DOCTYPE plist PUBLIC "-//Apple//DTD PLIST 1.0//EN" "http://www.apple.com/DTDs/PropertyList-1.0.dtd">
-<plist version="1.0">
-<dict>
-    <key>method</key>
-    <string>developer-id</string>
-    <key>teamID</key>
-    <string>{team_id}</string>
-    <key>signingStyle</key>
-    <string>automatic</string>
-    <key>uploadBitcode</key>
-    <false/>
-    <key>uploadSymbols</key>
-    <true/>
-    <key>compileBitcode</key>
-    <false/>
-    <key>signingCertificate</key>
-    <string>Developer ID Application</string>
-    <key>thinning</key>
-    <string>&lt;none&gt;</string>
-</dict>
-</plist>"""
+        # Create export options plist. plistlib takes care of escaping values
+        # such as the team ID and the "<none>" thinning option.
+        export_options = {
+            "method": "developer-id",
+            "teamID": team_id,
+            "signingStyle": "automatic",
+            "uploadBitcode": False,
+            "uploadSymbols": True,
+            "compileBitcode": False,
+            "signingCertificate": "Developer ID Application",
+            "thinning": "<none>",
+        }
 
         export_options_path = archive_dir / "ExportOptions.plist"
         # Don't track ExportOptions.plist for rollback - we want to keep it
-        with open(export_options_path, "w") as f:
-            f.write(export_options)
+        with open(export_options_path, "wb") as f:
+            plistlib.dump(export_options, f, sort_keys=False)
 
         run_command(
             [
@@ -1119,7 +1660,8 @@ def build_xcode_archive(
         if binary_path.exists():
             result = run_command(
                 ["lipo", "-info", str(binary_path)],
-                show_output=False
+                show_output=False,
+                text=True,
             )
             if "x86_64" not in result.stdout or "arm64" not in result.stdout:
                 console.print(f"{Icons.WARNING} Binary architecture check: {result.stdout}")
@@ -1132,13 +1674,121 @@ def build_xcode_archive(
                 if VERBOSE:
                     console.print(f"{Icons.SUCCESS} Verified universal binary: {result.stdout.strip()}")
 
-        # Note: Don't re-sign here - we'll sign after cleaning in final location
+        # Note: Don't re-sign here - we'll sign after cleaning in final location
+
+        return app_path
+
+
+def _strip_xattrs(path: str) -> None:
+    """Remove every extended attribute from a path, skipping those with none"""
+    for attr in os.listxattr(path, follow_symlinks=False):
+        os.removexattr(path, attr, follow_symlinks=False)
+
+
+def _clean_bundles(roots: List[Path], remove_files: bool = True) -> None:
+    """Clear extended attributes under each root and delete .DS_Store and
+    AppleDouble (._*) files.
+
+    Python only exposes the xattr syscalls on some platforms. Where it does,
+    both happen in a single walk that only removes attributes that exist;
+    elsewhere (including macOS) one `xattr -cr` clears all the roots first.
+    """
+    if not roots:
+        return
+
+    in_process = hasattr(os, "listxattr")
+    if not in_process:
+        run_command(["xattr", "-cr", *map(str, roots)], show_output=False)
+        if not remove_files:
+            return
+
+    for root in roots:
+        for dirpath, _dirnames, filenames in os.walk(root):
+            if in_process:
+                _strip_xattrs(dirpath)
+            for name in filenames:
+                path = os.path.join(dirpath, name)
+                if remove_files and (name == ".DS_Store" or name.startswith("._")):
+                    os.unlink(path)
+                elif in_process:
+                    _strip_xattrs(path)
+
+
+def _is_signed_by_team(bundle: Path, team_id: str) -> bool:
+    """Check whether a bundle already has a signature we would have produced:
+    valid, from our team's Developer ID certificate, with the hardened runtime
+    and a secure timestamp
+    """
+    # A plain --verify also accepts ad-hoc, Apple Development or third-party
+    # signatures, so pin the requirement to a Developer ID Application
+    # certificate issued to this team
+    requirement = (
+        "=anchor apple generic"
+        " and certificate 1[field.1.2.840.113635.100.6.2.6]"
+        " and certificate leaf[field.1.2.840.113635.100.6.1.13]"
+        f' and certificate leaf[subject.OU] = "{team_id}"'
+    )
+    result = run_command(
+        ["codesign", "--verify", "--strict", f"-R{requirement}", str(bundle)],
+        check=False,
+        show_output=False,
+    )
+    if result.returncode != 0:
+        return False
+
+    # The requirement can't express signing options, so check those in the
+    # signature details, which codesign writes to stderr
+    result = run_command(
+        ["codesign", "-dv", str(bundle)], check=False, show_output=False, text=True
+    )
+    flags = CODESIGN_FLAGS_RE.search(result.stderr)
+    return (
+        result.returncode == 0
+        and flags is not None
+        and "runtime" in flags.group(1).split(",")
+        and CODESIGN_TIMESTAMP_RE.search(result.stderr) is not None
+    )
 
-        return app_path
+
+def _sign_bundles(bundles: List[Path], developer_id: str) -> None:
+    """Clean and sign a group of nested bundles (XPC services or frameworks).
+
+    Bundles that are already signed by our team only have their extended
+    attributes cleaned. codesign accepts several paths, so the rest of the
+    group is signed with one process instead of one per bundle.
+    """
+    team_id = os.environ["APPLE_TEAM_ID"]
+    signed, unsigned = [], []
+    with ThreadPoolExecutor(max_workers=max(1, min(8, len(bundles)))) as executor:
+        checks = executor.map(lambda bundle: _is_signed_by_team(bundle, team_id), bundles)
+        for bundle, is_signed in zip(bundles, checks):
+            (signed if is_signed else unsigned).append(bundle)
+
+    # Clean these bundles before signing
+    _clean_bundles(signed, remove_files=False)
+    _clean_bundles(unsigned)
+
+    if not unsigned:
+        return
+
+    run_command(
+        [
+            "codesign",
+            "--force",
+            "--sign",
+            developer_id,
+            "--options",
+            "runtime",
+            "--timestamp",
+            *map(str, unsigned),
+        ],
+        show_output=False,
+    )
 
 
 def clean_and_sign_app(app_path: Path) -> None:
     """Deep clean and sign app for notarization"""
+    unlock_signing_keychain()
     developer_id = get_developer_id_certificate()
 
     if not QUIET:
@@ -1160,22 +1810,10 @@ def clean_and_sign_app(app_path: Path) -> None:
             status_branch.add("Cleaning extended attributes only")
             console.print(sign_tree)
 
-        # Clean extended attributes without affecting signatures
-        run_command(["xattr", "-cr", str(app_path)], show_output=False)
-
-        # Remove .DS_Store and ._* files
-        run_command(
-            ["find", str(app_path), "-name", ".DS_Store", "-delete"], show_output=False
-        )
-        run_command(
-            ["find", str(app_path), "-name", "._*", "-delete"], show_output=False
-        )
-
-        # Verify signature is still valid
-        run_command(
-            ["codesign", "--verify", "--deep", "--strict", str(app_path)],
-            show_output=False,
-        )
+        # Clean extended attributes and remove .DS_Store and ._* files. Neither
+        # touches the sealed resources, so the signature verified above is
+        # still valid and doesn't need checking again.
+        _clean_bundles([app_path])
 
         return
 
@@ -1185,156 +1823,84 @@ def clean_and_sign_app(app_path: Path) -> None:
         console.print(sign_tree)
 
     # Phase 1: Deep clean extended attributes and resource forks
-    if not QUIET:
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console,
-        ) as progress:
-            task = progress.add_task("Cleaning extended attributes...", total=None)
-
-            # Remove all extended attributes recursively
-            run_command(["xattr", "-cr", str(app_path)], show_output=False)
-
-            # Remove all .DS_Store files
-            run_command(
-                ["find", str(app_path), "-name", ".DS_Store", "-delete"],
-                show_output=False,
-            )
-
-            # Remove ._* files (AppleDouble format files)
-            run_command(
-                ["find", str(app_path), "-name", "._*", "-delete"], show_output=False
-            )
+    with maybe_progress() as progress:
+        task = progress.add_task("Cleaning extended attributes...", total=None)
 
-            # Use dot_clean to merge and clean AppleDouble files
-            run_command(
-                ["dot_clean", "-m", str(app_path)], check=False, show_output=False
-            )  # dot_clean might not be available
-    else:
-        # Just run the commands without progress
-        run_command(["xattr", "-cr", str(app_path)], show_output=False)
-        run_command(
-            ["find", str(app_path), "-name", ".DS_Store", "-delete"], show_output=False
-        )
-        run_command(
-            ["find", str(app_path), "-name", "._*", "-delete"], show_output=False
-        )
-        run_command(["dot_clean", "-m", str(app_path)], check=False, show_output=False)
+        # Remove all extended attributes recursively, along with .DS_Store and
+        # ._* (AppleDouble format) files. Merging the AppleDouble files with
+        # dot_clean first is pointless since the extended attributes they would
+        # restore are cleared anyway.
+        _clean_bundles([app_path])
 
     # Phase 2: Sign components in correct order (deepest first)
     frameworks_dir = app_path / "Contents" / "Frameworks"
     if frameworks_dir.exists():
-        # Use a set to track already signed paths to avoid signing symlinked content twice
-        signed_paths = set()
+        # Collect XPC services (at any depth) and top-level frameworks in one
+        # walk. Symlinked directories are listed but not descended into.
+        xpc_services = []
+        frameworks = []
+        for dirpath, dirnames, _filenames in os.walk(frameworks_dir):
+            for name in dirnames:
+                if name.endswith(".xpc"):
+                    xpc_services.append(Path(dirpath, name))
+                elif name.endswith(".framework") and dirpath == str(frameworks_dir):
+                    frameworks.append(Path(dirpath, name))
+
+        # Track signed bundles by device and inode to avoid signing symlinked
+        # content twice, which takes one stat per bundle instead of resolving
+        # every path component
+        signed_inodes = set()
 
         # Build list of all bundles to sign, starting with deepest (XPC services) first
         bundles_to_sign = []
-
-        # XPC services are deepest in the hierarchy
-        for xpc in frameworks_dir.rglob("*.xpc"):
-            # Resolve symlinks to get the real path
-            real_path = xpc.resolve()
-
-            # Skip if we've already signed this real path
-            if real_path in signed_paths:
-                console.print(f"[dim]Skipping XPC service (symlink): {xpc.name}[/dim]")
-                continue
-
-            signed_paths.add(real_path)
-            bundles_to_sign.append(("XPC service", xpc))
-
-        # Then frameworks
-        for framework in frameworks_dir.glob("*.framework"):
-            # Resolve symlinks to get the real path
-            real_path = framework.resolve()
-
-            # Skip if we've already signed this real path
-            if real_path in signed_paths:
-                console.print(
-                    f"[dim]Skipping framework (symlink): {framework.name}[/dim]"
-                )
-                continue
-
-            signed_paths.add(real_path)
-            bundles_to_sign.append(("framework", framework))
+        for bundle_type, candidates in (("XPC service", xpc_services), ("framework", frameworks)):
+            for bundle in candidates:
+                stat = os.stat(bundle)
+                inode = (stat.st_dev, stat.st_ino)
+
+                # Skip if we've already signed this bundle through another path
+                if inode in signed_inodes:
+                    console.print(f"[dim]Skipping {bundle_type} (symlink): {bundle.name}[/dim]")
+                    continue
+
+                signed_inodes.add(inode)
+                bundles_to_sign.append((bundle_type, bundle))
+
+        # Bundles at the same depth don't contain each other, so each group can
+        # be signed with a single codesign call. XPC services must be signed
+        # before the frameworks that embed them are sealed.
+        bundle_groups = [
+            (group_type, [bundle for bundle_type, bundle in bundles_to_sign if bundle_type == group_type])
+            for group_type in ("XPC service", "framework")
+        ]
 
         # Sign all bundles
-        if not QUIET and bundles_to_sign:
-            with Progress(
+        if bundles_to_sign:
+            with maybe_progress(
                 SpinnerColumn(),
                 TextColumn("[progress.description]{task.description}"),
                 BarColumn(),
                 TaskProgressColumn(),
-                console=console,
             ) as progress:
                 sign_task = progress.add_task(
                     "Signing frameworks...", total=len(bundles_to_sign)
                 )
 
-                for bundle_type, bundle in bundles_to_sign:
-                    progress.update(sign_task, description=f"Signing {bundle.name}...")
-
-                    # Clean this specific bundle before signing
-                    run_command(["xattr", "-cr", str(bundle)], show_output=False)
-
-                    # Remove any ._* files in the bundle
-                    run_command(
-                        ["find", str(bundle), "-name", "._*", "-delete"],
-                        check=False,
-                        show_output=False,
-                    )
-
-                    run_command(
-                        [
-                            "codesign",
-                            "--force",
-                            "--sign",
-                            developer_id,
-                            "--options",
-                            "runtime",
-                            "--timestamp",
-                            str(bundle),
-                        ],
-                        show_output=False,
+                for group_type, group in bundle_groups:
+                    if not group:
+                        continue
+                    progress.update(
+                        sign_task, description=f"Signing {len(group)} {group_type}(s)..."
                     )
-
-                    progress.advance(sign_task)
-        else:
-            for bundle_type, bundle in bundles_to_sign:
-                # Clean this specific bundle before signing
-                run_command(["xattr", "-cr", str(bundle)], show_output=False)
-                run_command(
-                    ["find", str(bundle), "-name", "._*", "-delete"],
-                    check=False,
-                    show_output=False,
-                )
-                run_command(
-                    [
-                        "codesign",
-                        "--force",
-                        "--sign",
-                        developer_id,
-                        "--options",
-                        "runtime",
-                        "--timestamp",
-                        str(bundle),
-                    ],
-                    show_output=False,
-                )
+                    _sign_bundles(group, developer_id)
+                    progress.advance(sign_task, len(group))
 
     # Phase 3: Sign the main app
     if not QUIET:
         console.print(f"\n{Icons.PROGRESS} Signing main app bundle...")
 
     # Final clean before signing the main app
-    run_command(["xattr", "-cr", str(app_path)], show_output=False)
-    run_command(["xattr", "-c", str(app_path)], show_output=False)
-    run_command(
-        ["find", str(app_path), "-name", "._*", "-delete"],
-        check=False,
-        show_output=False,
-    )
+    _clean_bundles([app_path])
 
     # Sign the main app with --deep to ensure everything is signed
     run_command(
@@ -1361,6 +1927,18 @@ def clean_and_sign_app(app_path: Path) -> None:
         console.print(f"{Icons.SUCCESS} App signed successfully")
 
 
+@cache
+def developer_id_pattern(team_id: str) -> re.Pattern[bytes]:
+    """Compile the pattern matching a team's Developer ID Application identity.
+
+    Matches raw `security find-identity` output so it doesn't need decoding.
+    """
+    return re.compile(
+        rb'"(Developer ID Application: [^"]+\(%b\))"' % re.escape(team_id.encode())
+    )
+
+
+@cache
 def get_developer_id_certificate() -> str:
     """Get the Developer ID Application certificate name from the keychain"""
     team_id = os.environ.get("APPLE_TEAM_ID")
@@ -1369,46 +1947,64 @@ def get_developer_id_certificate() -> str:
 
     # Query keychain for Developer ID Application certificates
     result = run_command(
-        ["security", "find-identity", "-v", "-p", "codesigning"], show_output=False
+        ["security", "find-identity", "-v", "-p", "codesigning"],
+        show_output=False,
     )
 
     # Look for Developer ID Application certificate with matching team ID
-    import re
-
-    pattern = rf'"(Developer ID Application: [^"]+\({team_id}\))"'
-    match = re.search(pattern, result.stdout)
+    match = developer_id_pattern(team_id).search(result.stdout)
 
     if not match:
         raise ReleaseError(
             f"Could not find Developer ID Application certificate for team {team_id}"
         )
 
-    return match.group(1)
+    return match.group(1).decode("utf-8")
+
+
+def discard_tree(path: Path) -> None:
+    """Remove a directory tree without waiting for it to be deleted.
+
+    The tree is renamed out of the way (instant on the same filesystem) and then
+    deleted by a detached `rm -rf`, which is much faster than shutil.rmtree and
+    finishes even if this script exits first.
+    """
+    trash_dir = Path(tempfile.mkdtemp(prefix=".trash-", dir=path.parent))
+    os.rename(path, trash_dir / path.name)
+    subprocess.Popen(
+        ["rm", "-rf", str(trash_dir)],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True,
+    )
 
 
 def prepare_dmg_contents(app_path: Path, archive_dir: Path) -> Tuple[Path, Path, Path]:
     """Prepare DMG contents by copying app to proper structure"""
     assert CONFIG is not None, "CONFIG must be initialized"
     
-    # Copy app to archive directory, preserving symlinks
+    # The signed app is moved back here once the DMG has been created
     archive_app_path = archive_dir / f"{CONFIG['app_name']}.app"
     if archive_app_path.exists():
-        shutil.rmtree(archive_app_path)
-    shutil.copytree(app_path, archive_app_path, symlinks=True)
+        discard_tree(archive_app_path)
 
     # Create a directory structure for DMG contents
     dmg_contents = archive_dir / "dmg_contents"
     if dmg_contents.exists():
-        shutil.rmtree(dmg_contents)
+        discard_tree(dmg_contents)
     dmg_contents.mkdir()
 
     # Create product folder inside dmg_contents
     product_folder = dmg_contents / CONFIG["app_name"]
     product_folder.mkdir()
 
-    # Move app into the product folder (shutil.move preserves symlinks)
+    # Copy app straight into the product folder. On APFS, cp -c clones the
+    # files instead of copying their data; -R keeps symlinks as symlinks and
+    # -p preserves modes and timestamps.
     final_app_path = product_folder / f"{CONFIG['app_name']}.app"
-    shutil.move(str(archive_app_path), str(final_app_path))
+    run_command(
+        ["cp", "-cRp", str(app_path), str(final_app_path)], show_output=False
+    )
 
     return archive_app_path, dmg_contents, final_app_path
 
@@ -1421,7 +2017,8 @@ def create_dmg(product_folder: Path, dmg_path: Path) -> None:
             console.print(f"[dim]Removing existing DMG: {dmg_path}[/dim]")
         dmg_path.unlink()
 
-    # Create DMG using the product folder
+    # Create DMG using the product folder. LZFSE (ULFO) compresses much faster
+    # than bzip2 (UDBZ) at a similar ratio and is supported since macOS 10.11.
     run_command(
         [
             "hdiutil",
@@ -1429,7 +2026,7 @@ def create_dmg(product_folder: Path, dmg_path: Path) -> None:
             "-srcfolder",
             str(product_folder),
             "-format",
-            "UDBZ",
+            "ULFO",
             str(dmg_path),
         ],
         show_output=VERBOSE,
@@ -1444,7 +2041,8 @@ def verify_universal_binary(app_path: Path) -> None:
     if binary_path.exists():
         result = run_command(
             ["lipo", "-info", str(binary_path)],
-            show_output=False
+            show_output=False,
+            text=True,
         )
         if "x86_64" not in result.stdout or "arm64" not in result.stdout:
             raise ReleaseError(f"Binary is not universal: {result.stdout}")
@@ -1460,6 +2058,7 @@ def sign_dmg(dmg_path: Path) -> None:
     run_command(["xattr", "-c", str(dmg_path)], show_output=False)
 
     # Sign the DMG with Developer ID certificate
+    unlock_signing_keychain()
     developer_id = get_developer_id_certificate()
     if VERBOSE:
         console.print(f"[dim]Using certificate: {developer_id}[/dim]")
@@ -1502,21 +2101,16 @@ def notarize_dmg(dmg_path: Path, archive_dir: Path) -> None:
         ]
     )
 
-    # Write the plist output to file
-    with open(notarization_response_path, "w") as f:
-        f.write(result.stdout)
-
-    # Parse the plist to check notarization status
-    import plistlib
-
-    with open(notarization_response_path, "rb") as f:
-        notarization_response = plistlib.load(f)
+    # Parse the plist output to check notarization status
+    notarization_response = plistlib.loads(result.stdout)
 
     status = notarization_response.get("status", "Unknown")
     message = notarization_response.get("message", "No message provided")
 
-    # Log full response for debugging
-    if VERBOSE:
+    # Save full response for debugging. There's nothing to look into when
+    # notarization succeeds, so only keep it then in verbose mode.
+    if status != "Accepted" or VERBOSE:
+        notarization_response_path.write_bytes(result.stdout)
         console.print(
             f"[dim]Notarization response saved to: {notarization_response_path}[/dim]"
         )
@@ -1554,21 +2148,17 @@ def handle_notarization_failure(
                 submission_id,
                 "--keychain-profile",
                 keychain_profile,
-            ]
+            ],
+            text=True,
         )
 
-        # Save the log to a file
+        # Save the raw log to a file for debugging the failure
         log_path = archive_dir / "notarization_log.json"
-        with open(log_path, "w") as f:
-            f.write(log_result.stdout)
-
-        if VERBOSE:
-            console.print(f"[dim]Notarization log saved to: {log_path}[/dim]")
+        log_path.write_text(log_result.stdout, encoding="utf-8")
+        console.print(f"[dim]Notarization log saved to: {log_path}[/dim]")
 
         # Try to parse and display key issues
         try:
-            import json
-
             log_data = json.loads(log_result.stdout)
 
             if "issues" in log_data:
@@ -1594,23 +2184,24 @@ def handle_notarization_failure(
             console.print(log_result.stdout)
 
 
+def get_dmg_path(archive_dir: Path, marketing_version: str) -> Path:
+    """Get the path the release DMG is written to"""
+    assert CONFIG is not None, "CONFIG must be initialized"
+    return archive_dir / f"{CONFIG['app_name']}_v{marketing_version}.dmg"
+
+
 def create_and_notarize_dmg(
     app_path: Path,
     archive_dir: Path,
     marketing_version: str,
     rollback_manager: RollbackManager,
-) -> Path:
+) -> DmgArtifact:
     """Create DMG and submit for notarization"""
     assert CONFIG is not None, "CONFIG must be initialized"
     
-    dmg_name = f"{CONFIG['app_name']}_v{marketing_version}.dmg"
-    dmg_path = archive_dir / dmg_name
-
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        console=console,
-    ) as progress:
+    dmg_path = get_dmg_path(archive_dir, marketing_version)
+
+    with maybe_progress() as progress:
         # Prepare DMG contents
         task = progress.add_task("Copying app to archive directory...", total=None)
         archive_app_path, dmg_contents, final_app_path = prepare_dmg_contents(
@@ -1635,18 +2226,19 @@ def create_and_notarize_dmg(
         progress.update(task, description="Signing DMG...")
         sign_dmg(dmg_path)
 
-        # Copy the app back to archive directory (using cp -a to preserve attributes)
-        run_command(["cp", "-a", str(final_app_path), str(archive_app_path)])
+        # Move the signed app back to the archive directory. Both paths are
+        # under archive_dir, so this is a rename rather than a copy.
+        os.rename(final_app_path, archive_app_path)
 
         # Clean up
-        shutil.rmtree(dmg_contents)
+        discard_tree(dmg_contents)
 
         # Submit for notarization
         progress.update(task, description="Submitting for notarization...")
         notarize_dmg(dmg_path, archive_dir)
 
     console.print(f"[green]✓[/green] DMG created and notarized: {dmg_path}")
-    return dmg_path
+    return DmgArtifact.from_path(dmg_path)
 
 
 def sign_update(dmg_path: Path) -> Tuple[str, str]:
@@ -1661,7 +2253,7 @@ def sign_update(dmg_path: Path) -> Tuple[str, str]:
     sign_update_path.chmod(0o755)
 
     try:
-        result = run_command([str(sign_update_path), str(dmg_path)])
+        result = run_command([str(sign_update_path), str(dmg_path)], text=True)
     except subprocess.CalledProcessError as e:
         error_output = getattr(e, "stdout", "") or ""
         if "Unable to access required key in the Keychain" in error_output:
@@ -1723,8 +2315,8 @@ def sign_update(dmg_path: Path) -> Tuple[str, str]:
     # Parse the output to extract signature and length
     output = result.stdout.strip()
 
-    sig_match = re.search(r'sparkle:edSignature="([^"]+)"', output)
-    len_match = re.search(r'length="(\d+)"', output)
+    sig_match = SPARKLE_SIGNATURE_RE.search(output)
+    len_match = SPARKLE_LENGTH_RE.search(output)
 
     if not sig_match or not len_match:
         raise ReleaseError(f"Could not parse sign_update output: {output}")
@@ -1732,23 +2324,82 @@ def sign_update(dmg_path: Path) -> Tuple[str, str]:
     return sig_match.group(1), len_match.group(1)
 
 
+def render_appcast_item(
+    marketing_version: str,
+    project_version: int,
+    signature: str,
+    length: str,
+    release_notes_html: str,
+    indent: str = "",
+) -> str:
+    """Render the appcast <item> for a release, indented to sit in the channel"""
+    assert CONFIG is not None, "CONFIG must be initialized"
+
+    child_indent = indent + "  "
+    title = f"Version {marketing_version} ({project_version})"
+    min_sys_version = CONFIG.get("minimum_system_version", "15.0")
+    pub_date = datetime.now(timezone.utc).strftime("%a, %d %b %Y %H:%M:%S +0000")
+    enclosure_url = f"https://github.com/{CONFIG['github_owner']}/{CONFIG['github_repo']}/releases/download/v{marketing_version}/{CONFIG['app_name']}_v{marketing_version}.dmg"
+
+    # A literal "]]>" would end the CDATA description early, so split it
+    # across two sections
+    html_content = release_notes_html.replace("]]>", "]]]]><![CDATA[>")
+
+    return (
+        f"{indent}<item>\n"
+        f"{child_indent}<title>{escape(title)}</title>\n"
+        f"{child_indent}<link>{escape(CONFIG['website_url'])}</link>\n"
+        f"{child_indent}<sparkle:version>{project_version}</sparkle:version>\n"
+        f"{child_indent}<sparkle:shortVersionString>{escape(marketing_version)}</sparkle:shortVersionString>\n"
+        f"{child_indent}<sparkle:minimumSystemVersion>{escape(min_sys_version)}</sparkle:minimumSystemVersion>\n"
+        f"{child_indent}<description><![CDATA[{html_content}]]></description>\n"
+        f"{child_indent}<pubDate>{pub_date}</pubDate>\n"
+        f"{child_indent}<enclosure url={quoteattr(enclosure_url)} sparkle:edSignature={quoteattr(signature)}"
+        f" length={quoteattr(length)} type=\"application/octet-stream\"/>\n"
+        f"{indent}</item>\n"
+    )
+
+
 def update_appcast(
     marketing_version: str,
     project_version: int,
     signature: str,
     length: str,
-    changelog_items: str,
+    release_notes_html: str,
     rollback_manager: RollbackManager,
 ) -> None:
     """Update appcast.xml with new release information"""
-    assert CONFIG is not None, "CONFIG must be initialized"
-    
     appcast_path = Path("appcast.xml")
+    appcast = appcast_path.read_text(encoding="utf-8")
 
     # Backup appcast.xml before modifying
-    rollback_manager.backup_file(appcast_path)
+    rollback_manager.backup_file(appcast_path, appcast)
+
+    # Insert the new item as text just before the newest existing item, so the
+    # rest of the file is left as-is rather than reparsed and re-serialized
+    channel_start = appcast.find("<channel>")
+    first_item = appcast.find("<item>", channel_start) if channel_start != -1 else -1
+    if first_item != -1:
+        line_start = appcast.rfind("\n", 0, first_item) + 1
+        indent = appcast[line_start:first_item]
+        if not indent.strip():
+            new_item = render_appcast_item(
+                marketing_version, project_version, signature, length, release_notes_html, indent
+            )
+            appcast_path.write_text(
+                appcast[:line_start] + new_item + appcast[line_start:], encoding="utf-8"
+            )
+            return
+
+    # Fall back to editing the parsed document, e.g. for the first release
+    new_item_xml = render_appcast_item(
+        marketing_version, project_version, signature, length, release_notes_html
+    )
+    item_parser = etree.XMLParser(remove_blank_text=True, strip_cdata=False)
+    new_item = etree.fromstring(
+        f'<rss xmlns:sparkle="{SPARKLE_NS}">{new_item_xml}</rss>', item_parser
+    )[0]
 
-    # Parse existing appcast
     parser = etree.XMLParser(remove_blank_text=True)
     tree = etree.parse(str(appcast_path), parser)
     root = tree.getroot()
@@ -1758,61 +2409,6 @@ def update_appcast(
     if channel is None:
         raise ReleaseError("Could not find channel element in appcast.xml")
 
-    # Create new item
-    new_item = etree.Element("item")
-
-    # Add title
-    title = etree.SubElement(new_item, "title")
-    title.text = f"Version {marketing_version} ({project_version})"
-
-    # Add link
-    link = etree.SubElement(new_item, "link")
-    link.text = CONFIG["website_url"]
-
-    # Add version info
-    sparkle_ns = "http://www.andymatuschak.org/xml-namespaces/sparkle"
-    etree.SubElement(new_item, f"{{{sparkle_ns}}}version").text = str(project_version)
-    etree.SubElement(
-        new_item, f"{{{sparkle_ns}}}shortVersionString"
-    ).text = marketing_version
-
-    # Add minimum system version
-    min_sys_version = CONFIG.get("minimum_system_version", "15.0")
-    etree.SubElement(
-        new_item, f"{{{sparkle_ns}}}minimumSystemVersion"
-    ).text = min_sys_version
-
-    # Add description with HTML release notes in CDATA
-    description = etree.SubElement(new_item, "description")
-    # Convert markdown to HTML
-    html_content = markdown2.markdown(
-        changelog_items,
-        extras=[
-            "fenced-code-blocks",
-            "tables",
-            "strike",
-            "target-blank-links",
-            "task_list",
-            "code-friendly",
-        ],
-    )
-    # Wrap in CDATA
-    description.text = etree.CDATA(html_content)
-
-    # Add publication date
-    pub_date = etree.SubElement(new_item, "pubDate")
-    pub_date.text = datetime.now(timezone.utc).strftime("%a, %d %b %Y %H:%M:%S +0000")
-
-    # Add enclosure
-    enclosure = etree.SubElement(new_item, "enclosure")
-    enclosure.set(
-        "url",
-        f"https://github.com/{CONFIG['github_owner']}/{CONFIG['github_repo']}/releases/download/v{marketing_version}/{CONFIG['app_name']}_v{marketing_version}.dmg",
-    )
-    enclosure.set(f"{{{sparkle_ns}}}edSignature", signature)
-    enclosure.set("length", length)
-    enclosure.set("type", "application/octet-stream")
-
     # Insert new item after the last <title> element and before first <item>
     insert_index = 0
     for i, child in enumerate(channel):
@@ -1842,11 +2438,7 @@ def create_git_commit_and_tag(marketing_version: str, changelog_items: str) -> T
     """
     pushed = False
     
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        console=console,
-    ) as progress:
+    with maybe_progress() as progress:
         # Add all changed files
         task = progress.add_task("Creating git commit...", total=None)
         run_command(["git", "add", "-A"])
@@ -1873,6 +2465,30 @@ def create_git_commit_and_tag(marketing_version: str, changelog_items: str) -> T
     return tag_name, pushed
 
 
+def get_dsyms_cache_key(dsyms_path: Path) -> Optional[str]:
+    """Hash the DWARF UUIDs of every dSYM, which identify the build they're from"""
+    dsyms = sorted(str(dsym) for dsym in dsyms_path.glob("*.dSYM"))
+    if not dsyms:
+        return None
+
+    result = run_command(
+        ["dwarfdump", "--uuid", *dsyms], check=False, show_output=False
+    )
+    uuids = sorted(DWARF_UUID_RE.findall(result.stdout))
+    if result.returncode != 0 or not uuids:
+        return None
+
+    return hashlib.sha256(repr(uuids).encode()).hexdigest()[:16]
+
+
+def _link_or_copy(source: Path, destination: Path) -> None:
+    """Hard link a file, copying it instead where the filesystem can't link"""
+    try:
+        os.link(source, destination)
+    except OSError:
+        shutil.copy2(source, destination)
+
+
 def create_dsyms_zip(archive_dir: Path, dmg_path: Path) -> Optional[Path]:
     """Create a ZIP file of the dSYMs directory"""
     assert CONFIG is not None, "CONFIG must be initialized"
@@ -1891,14 +2507,42 @@ def create_dsyms_zip(archive_dir: Path, dmg_path: Path) -> Optional[Path]:
     dsyms_zip_name = f"{dmg_name}_dSYMs.zip"
     dsyms_zip_path = archive_dir / dsyms_zip_name
 
-    if not QUIET:
-        console.print(f"{Icons.PROGRESS} Creating dSYMs ZIP archive...")
+    # A previous attempt may already have zipped these exact dSYMs, e.g. if it
+    # failed during notarization. Reuse that ZIP rather than recompressing.
+    cache_key = get_dsyms_cache_key(dsyms_path)
+    cached_zip_path = archive_dir / f".dsyms_cache_{cache_key}.zip" if cache_key else None
+    if dsyms_zip_path.exists():
+        dsyms_zip_path.unlink()
 
-    # Use ditto to create the ZIP file
-    run_command(
-        ["ditto", "-c", "-k", "--keepParent", str(dsyms_path), str(dsyms_zip_path)],
-        show_output=VERBOSE,
-    )
+    if cached_zip_path is not None and cached_zip_path.exists():
+        if not QUIET:
+            console.print(f"{Icons.INFO} Reusing dSYMs ZIP from a previous attempt")
+        _link_or_copy(cached_zip_path, dsyms_zip_path)
+    else:
+        if not QUIET:
+            console.print(f"{Icons.PROGRESS} Creating dSYMs ZIP archive...")
+
+        # Use ditto to create the ZIP file. DWARF data compresses well even at
+        # the fastest zlib level, which is much quicker than the default of 6.
+        run_command(
+            [
+                "ditto",
+                "-c",
+                "-k",
+                "--keepParent",
+                "--zlibCompressionLevel",
+                "1",
+                str(dsyms_path),
+                str(dsyms_zip_path),
+            ],
+            show_output=VERBOSE,
+        )
+
+        if cached_zip_path is not None:
+            # Only the newest dSYMs are worth keeping, so drop older entries
+            for stale_zip_path in archive_dir.glob(".dsyms_cache_*.zip"):
+                stale_zip_path.unlink()
+            _link_or_copy(dsyms_zip_path, cached_zip_path)
 
     # Get ZIP size for logging
     zip_size_mb = dsyms_zip_path.stat().st_size / (1024 * 1024)
@@ -1910,35 +2554,44 @@ def create_dsyms_zip(archive_dir: Path, dmg_path: Path) -> Optional[Path]:
     return dsyms_zip_path
 
 
+def upload_release_asset(tag_name: str, asset_path: Path, attempts: int = 3) -> None:
+    """Upload an asset to a GitHub release, retrying with exponential backoff"""
+    for attempt in range(1, attempts + 1):
+        try:
+            run_command(
+                ["gh", "release", "upload", tag_name, str(asset_path), "--clobber"]
+            )
+            return
+        except ReleaseError:
+            if attempt == attempts:
+                raise
+            delay = 2 ** attempt
+            if not QUIET:
+                console.print(
+                    f"{Icons.WARNING} Uploading {asset_path.name} failed, retrying in {delay}s..."
+                )
+            time.sleep(delay)
+
+
 def create_github_release(
     tag_name: str,
-    dmg_path: Path,
+    dmg: DmgArtifact,
     marketing_version: str,
     dsyms_zip_path: Optional[Path],
 ) -> str:
     """Create GitHub release with DMG and optional dSYMs ZIP"""
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        console=console,
-    ) as progress:
+    with maybe_progress() as progress:
         task = progress.add_task("Creating GitHub release...", total=None)
 
-        # Build the command with DMG
-        cmd = ["gh", "release", "create", tag_name, str(dmg_path)]
-
-        # Add dSYMs ZIP if available
-        if dsyms_zip_path and dsyms_zip_path.exists():
-            cmd.append(str(dsyms_zip_path))
-            if not QUIET:
-                progress.update(
-                    task, description="Creating GitHub release with DMG and dSYMs..."
-                )
-
-        # Add remaining arguments
-        cmd.extend(
+        # Create the release as a draft so it isn't visible until every asset
+        # has been uploaded
+        run_command(
             [
-                "--latest",
+                "gh",
+                "release",
+                "create",
+                tag_name,
+                "--draft",
                 "--notes-from-tag",
                 "--verify-tag",
                 "--title",
@@ -1946,14 +2599,43 @@ def create_github_release(
             ]
         )
 
-        result = run_command(cmd)
+        try:
+            # Upload the DMG and dSYMs ZIP (if available) concurrently
+            assets = [dmg.path]
+            if dsyms_zip_path and dsyms_zip_path.exists():
+                assets.append(dsyms_zip_path)
+                progress.update(
+                    task, description="Uploading DMG and dSYMs to GitHub release..."
+                )
+            else:
+                progress.update(task, description="Uploading DMG to GitHub release...")
+
+            with ThreadPoolExecutor(max_workers=min(4, len(assets))) as executor:
+                futures = [
+                    executor.submit(upload_release_asset, tag_name, asset)
+                    for asset in assets
+                ]
+                for future in futures:
+                    future.result()
+
+            # Publish the release now that all assets are attached
+            progress.update(task, description="Publishing GitHub release...")
+            run_command(["gh", "release", "edit", tag_name, "--draft=false", "--latest"])
+        except BaseException:
+            # Don't leave a half-uploaded draft behind for the next attempt
+            # to trip over
+            run_command(
+                ["gh", "release", "delete", tag_name, "--yes"],
+                check=False,
+                show_output=False,
+            )
+            raise
 
-        # Extract release URL from output
-        release_url = None
-        for line in result.stdout.strip().split("\n"):
-            if line.startswith("https://github.com/"):
-                release_url = line
-                break
+        result = run_command(
+            ["gh", "release", "view", tag_name, "--json", "url", "--jq", ".url"],
+            text=True,
+        )
+        release_url = result.stdout.strip()
 
         if not release_url:
             raise ReleaseError("Could not find release URL in gh output")
@@ -1961,12 +2643,18 @@ def create_github_release(
     return release_url
 
 
-def upload_dsyms_to_sentry(archive_dir: Path, sentry_org: str, sentry_project: str) -> None:
+def upload_dsyms_to_sentry(
+    archive_dir: Path,
+    sentry_org: str,
+    sentry_project: str,
+    dsyms_zip_path: Optional[Path] = None,
+    attempts: int = 3,
+) -> None:
     """Upload dSYMs to Sentry for crash reporting"""
     assert CONFIG is not None, "CONFIG must be initialized"
     
     # Check if sentry-cli is available
-    if shutil.which("sentry-cli") is None:
+    if find_tool("sentry-cli") is None:
         console.print("[yellow]sentry-cli not found, skipping dSYM upload[/yellow]")
         return
 
@@ -1978,48 +2666,58 @@ def upload_dsyms_to_sentry(archive_dir: Path, sentry_org: str, sentry_project: s
         )
         return
 
-    # Find dSYMs directory
+    # Prefer the dSYMs ZIP made for the GitHub release, which sentry-cli
+    # uploads as a single archive instead of walking the dSYMs directory
     dsyms_path = archive_dir / f"{CONFIG['app_name']}.xcarchive" / "dSYMs"
-    if not dsyms_path.exists():
+    if dsyms_zip_path is not None and dsyms_zip_path.exists():
+        dsyms_path = dsyms_zip_path
+    elif not dsyms_path.exists():
         console.print(
             f"[yellow]dSYMs directory not found at {dsyms_path}, skipping upload[/yellow]"
         )
         return
 
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        console=console,
-    ) as progress:
+    with maybe_progress() as progress:
         task = progress.add_task("Uploading dSYMs to Sentry...", total=None)
 
-        try:
-            run_command(
-                [
-                    "sentry-cli",
-                    "debug-files",
-                    "upload",
-                    "--auth-token",
-                    sentry_auth_token,
-                    "--org",
-                    sentry_org,
-                    "--project",
-                    sentry_project,
-                    str(dsyms_path),
-                ]
-            )
-            console.print("[green]✓[/green] Successfully uploaded dSYMs to Sentry")
-        except Exception as e:
-            console.print(f"[yellow]Failed to upload dSYMs to Sentry: {e}[/yellow]")
-            console.print(
-                "[yellow]This is not a critical error, continuing...[/yellow]"
-            )
+        # Retry transient upload failures with exponential backoff
+        for attempt in range(1, attempts + 1):
+            try:
+                run_command(
+                    [
+                        "sentry-cli",
+                        "debug-files",
+                        "upload",
+                        "--auth-token",
+                        sentry_auth_token,
+                        "--org",
+                        sentry_org,
+                        "--project",
+                        sentry_project,
+                        str(dsyms_path),
+                    ]
+                )
+                console.print("[green]✓[/green] Successfully uploaded dSYMs to Sentry")
+                return
+            except Exception as e:
+                if attempt < attempts:
+                    delay = 2 ** attempt
+                    progress.update(
+                        task,
+                        description=f"Upload failed, retrying in {delay}s (attempt {attempt + 1}/{attempts})...",
+                    )
+                    time.sleep(delay)
+                    continue
+                console.print(f"[yellow]Failed to upload dSYMs to Sentry: {e}[/yellow]")
+                console.print(
+                    "[yellow]This is not a critical error, continuing...[/yellow]"
+                )
 
 
 def show_release_summary(
     marketing_version: str,
     project_version: int,
-    dmg_path: Path,
+    dmg: DmgArtifact,
     release_url: str,
     start_time: float,
     skipped_items: List[str],
@@ -2036,30 +2734,26 @@ def show_release_summary(
     minutes = int(duration // 60)
     seconds = int(duration % 60)
 
-    # Get DMG size
-    dmg_size_mb = dmg_path.stat().st_size / (1024 * 1024)
-
     # Create the main panel
-    summary_content = f"""
-[bold green]Release v{marketing_version} Published Successfully![/bold green]
-
-[bold]Version:[/bold] {marketing_version} (Build {project_version})
-[bold]DMG Size:[/bold] {dmg_size_mb:.1f} MB
-[bold]Location:[/bold] {dmg_path}
-[bold]Duration:[/bold] {minutes}m {seconds}s
-
-[bold]GitHub Release:[/bold]
-[link={release_url}]{release_url}[/link]
-"""
+    summary_lines = [
+        f"[bold green]Release v{marketing_version} Published Successfully![/bold green]",
+        "",
+        f"[bold]Version:[/bold] {marketing_version} (Build {project_version})",
+        f"[bold]DMG Size:[/bold] {dmg.size_mb:.1f} MB",
+        f"[bold]Location:[/bold] {dmg.path}",
+        f"[bold]Duration:[/bold] {minutes}m {seconds}s",
+        "",
+        "[bold]GitHub Release:[/bold]",
+        f"[link={release_url}]{release_url}[/link]",
+    ]
 
     if skipped_items:
-        summary_content += "\n[bold yellow]Skipped:[/bold yellow]\n"
-        for item in skipped_items:
-            summary_content += f"  • {item}\n"
+        summary_lines.extend(["", "[bold yellow]Skipped:[/bold yellow]"])
+        summary_lines.extend(f"  • {item}" for item in skipped_items)
 
     panel = Panel(
-        summary_content.strip(),
-        title="[bold]🎉 Release Summary[/bold]",
+        "\n".join(summary_lines),
+        title=RELEASE_SUMMARY_TITLE,
         border_style="green",
         padding=(1, 2),
         expand=False,
@@ -2070,34 +2764,32 @@ def show_release_summary(
     console.print()
 
 
+def file_contains(path: Path, text: str) -> bool:
+    """Check whether a file contains some text without reading and decoding it"""
+    with open(path, "rb") as f:
+        # mmap can't map an empty file
+        if os.fstat(f.fileno()).st_size == 0:
+            return False
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            return mapped.find(text.encode("utf-8")) != -1
+
+
 def verify_release(
-    dmg_path: Path, marketing_version: str, project_version: int
+    dmg: DmgArtifact, marketing_version: str, project_version: int
 ) -> None:
     """Verify the release artifacts"""
     if not QUIET:
         console.print()
-        console.rule("[bold blue]Release Verification[/bold blue]")
+        console.rule(section_title("Release Verification"))
 
     verification_results = []
 
-    # Verify DMG exists
-    if not dmg_path.exists():
-        raise ReleaseError(f"DMG not found at {dmg_path}")
-
-    dmg_size_mb = dmg_path.stat().st_size / (1024 * 1024)
-    verification_results.append((Icons.SUCCESS, f"DMG size: {dmg_size_mb:.1f} MB"))
+    # The DMG was checked to exist when it was finalized
+    verification_results.append((Icons.SUCCESS, f"DMG size: {dmg.size_mb:.1f} MB"))
 
-    # Verify DMG is signed
-    result = run_command(
-        ["codesign", "--verify", str(dmg_path)], check=False, show_output=False
-    )
-    if result.returncode != 0:
-        raise ReleaseError("DMG signature verification failed")
-
-    verification_results.append((Icons.SUCCESS, "DMG signature verified"))
-
-    # Verify DMG is notarized
-    result = run_command(
+    # Verify DMG is notarized. Gatekeeper's assessment checks the code
+    # signature too, so a passing spctl also proves the DMG is signed.
+    notarization_result = run_command(
         [
             "spctl",
             "-a",
@@ -2106,28 +2798,36 @@ def verify_release(
             "--context",
             "context:primary-signature",
             "-v",
-            str(dmg_path),
+            str(dmg.path),
         ],
         check=False,
         show_output=False,
     )
-    if result.returncode != 0:
+    if notarization_result.returncode == 0:
+        verification_results.append((Icons.SUCCESS, "DMG signature verified"))
+        verification_results.append((Icons.SUCCESS, "DMG notarization verified"))
+    else:
+        # Fall back to checking the signature on its own
+        signature_result = run_command(
+            ["codesign", "--verify", str(dmg.path)], check=False, show_output=False
+        )
+        if signature_result.returncode != 0:
+            raise ReleaseError("DMG signature verification failed")
+
+        verification_results.append((Icons.SUCCESS, "DMG signature verified"))
         verification_results.append(
             (
                 Icons.WARNING,
                 "DMG notarization check failed (may be normal if run immediately)",
             )
         )
-    else:
-        verification_results.append((Icons.SUCCESS, "DMG notarization verified"))
 
     # No longer verify release notes files since we embed them in appcast.xml
 
     # Verify appcast was updated
     appcast_path = Path("appcast.xml")
     if appcast_path.exists():
-        content = appcast_path.read_text()
-        if f"Version {marketing_version} ({project_version})" not in content:
+        if not file_contains(appcast_path, f"Version {marketing_version} ({project_version})"):
             verification_results.append(
                 (Icons.WARNING, "Appcast may not have been updated correctly")
             )
@@ -2137,12 +2837,12 @@ def verify_release(
     if not QUIET:
         # Create verification panel
         verification_content = "\n".join(
-            [f"{icon} {msg}" for icon, msg in verification_results]
+            f"{icon} {msg}" for icon, msg in verification_results
         )
 
         panel = Panel(
             verification_content,
-            title="[bold]Verification Results[/bold]",
+            title=VERIFICATION_RESULTS_TITLE,
             border_style="blue",
             padding=(1, 2),
         )
@@ -2171,6 +2871,9 @@ def main() -> None:
     new_marketing = None
     new_project = None
 
+    # Runs work that doesn't depend on the current step alongside it
+    executor = ThreadPoolExecutor(max_workers=2)
+
     try:
         # Parse arguments first to get config path
         args = parse_arguments()
@@ -2193,19 +2896,23 @@ def main() -> None:
                 )
             )
 
-        # Run validation tasks sequentially
+        # Run validation tasks in parallel
         if not QUIET:
             console.print()
-            console.rule("[bold blue]Validation Phase[/bold blue]")
+            console.rule(section_title("Validation Phase"))
 
         validation_tasks = [
             ("Validating tools", validate_tools, ()),
             ("Validating environment", validate_environment, ()),
-            ("Running pre-flight checks", preflight_checks, ()),
+            ("Running pre-flight checks", preflight_checks, (not args.no_fetch,)),
         ]
 
         try:
-            tool_results, env_vars, warnings = run_parallel_tasks(
+            (
+                tool_results,
+                env_vars,
+                (warnings, warning_tags, changelog_state),
+            ) = run_parallel_tasks(
                 validation_tasks, "Running validation checks"
             )
         except Exception as e:
@@ -2213,23 +2920,32 @@ def main() -> None:
             raise ReleaseError(f"Validation failed: {e}")
 
         # Show pre-release checklist
-        if not show_pre_release_checklist(warnings):
+        if not show_pre_release_checklist(warnings, warning_tags):
             raise ReleaseError("Release cancelled by user")
 
         # Get current versions
         if not QUIET:
             console.print()
-            console.rule("[bold blue]Version Management[/bold blue]")
+            console.rule(section_title("Version Management"))
 
+        # Read, increment and (unless skipping) write back the version numbers
         project_path = Path(CONFIG["xcode_project"]) / "project.pbxproj"
-        current_project, current_marketing = get_current_versions(
-            project_path, CONFIG["bundle_identifier"]
-        )
-
-        # Calculate new versions
-        new_project, new_marketing = increment_versions(
-            current_project, current_marketing, args.version_type
-        )
+        with console.status(
+            "Reading version numbers..."
+            if args.version_type == "skip"
+            else "Updating version numbers..."
+        ):
+            (
+                current_project,
+                current_marketing,
+                new_project,
+                new_marketing,
+            ) = read_and_update_versions(
+                project_path,
+                CONFIG["bundle_identifier"],
+                args.version_type,
+                rollback_manager,
+            )
 
         # Show version table
         show_version_table(
@@ -2240,38 +2956,28 @@ def main() -> None:
             args.version_type,
         )
 
-        # Update project versions (unless skipping)
         if args.version_type == "skip":
             if not QUIET:
                 console.print(f"{Icons.WARNING} Skipping version number update")
             skipped_items.append("Version number update")
-        else:
-            with console.status("Updating version numbers..."):
-                update_project_versions(
-                    project_path,
-                    CONFIG["bundle_identifier"],
-                    new_project,
-                    new_marketing,
-                    rollback_manager,
-                )
-            if not QUIET:
-                console.print(f"{Icons.SUCCESS} Updated version numbers")
+        elif not QUIET:
+            console.print(f"{Icons.SUCCESS} Updated version numbers")
 
         # Offer to update changelog with recent commits
         if not QUIET:
             console.print()
-            console.rule("[bold blue]Changelog Update[/bold blue]")
+            console.rule(section_title("Changelog Update"))
         
-        update_changelog_with_commits(rollback_manager)
+        changelog_state = update_changelog_with_commits(rollback_manager, changelog_state)
 
         # Process changelog
         if not QUIET:
             console.print()
-            console.rule("[bold blue]Changelog Processing[/bold blue]")
+            console.rule(section_title("Changelog Processing"))
 
         with console.status("Processing changelog..."):
             changelog_items = process_changelog(
-                new_project, new_marketing, rollback_manager
+                new_project, new_marketing, rollback_manager, changelog_state
             )
 
         if not QUIET:
@@ -2279,13 +2985,24 @@ def main() -> None:
                 f"{Icons.SUCCESS} Processed changelog and generated release notes"
             )
 
+        # Render the appcast release notes in the background
+        release_notes_future = rollback_manager.track_future(
+            executor.submit(markdown_to_html, changelog_items)
+        )
+
         # Show release notes preview
         show_release_notes_preview(changelog_items, new_marketing)
 
+        # Unlock the keychain for Sparkle signing now, while the user is still
+        # at the terminal, rather than prompting after the long build and
+        # notarization steps. It stays unlocked for the rest of the release.
+        if not args.skip_sparkle and not unlock_keychain():
+            raise ReleaseError("Failed to unlock keychain for Sparkle signing")
+
         # Build Xcode archive
         if not QUIET:
             console.print()
-            console.rule("[bold blue]Building Release[/bold blue]")
+            console.rule(section_title("Building Release"))
 
         app_path = build_xcode_archive(
             args.archive_path, CONFIG["bundle_identifier"], rollback_manager
@@ -2296,9 +3013,19 @@ def main() -> None:
         # Create and notarize DMG
         if not QUIET:
             console.print()
-            console.rule("[bold blue]DMG Creation & Notarization[/bold blue]")
+            console.rule(section_title("DMG Creation & Notarization"))
+
+        # Zip the dSYMs while the DMG is created, since they're only read from
+        # the archive
+        dsyms_zip_future = rollback_manager.track_future(
+            executor.submit(
+                create_dsyms_zip,
+                args.archive_path,
+                get_dmg_path(args.archive_path, new_marketing),
+            )
+        )
 
-        dmg_path = create_and_notarize_dmg(
+        dmg = create_and_notarize_dmg(
             app_path, args.archive_path, new_marketing, rollback_manager
         )
 
@@ -2313,51 +3040,52 @@ def main() -> None:
         else:
             if not QUIET:
                 console.print()
-                console.rule("[bold blue]Sparkle Update Signing[/bold blue]")
-
-            # Unlock keychain for Sparkle signing
-            if not unlock_keychain():
-                raise ReleaseError("Failed to unlock keychain for Sparkle signing")
+                console.rule(section_title("Sparkle Update Signing"))
 
             # Sign update
             with console.status("Signing update with Sparkle..."):
-                signature, length = sign_update(dmg_path)
+                signature, length = sign_update(dmg.path)
             if not QUIET:
                 console.print(f"{Icons.SUCCESS} Signed update")
 
             # Update appcast
             with console.status("Updating appcast.xml..."):
                 update_appcast(
-                    new_marketing, new_project, signature, length, changelog_items, rollback_manager
+                    new_marketing,
+                    new_project,
+                    signature,
+                    length,
+                    release_notes_future.result(),
+                    rollback_manager,
                 )
             if not QUIET:
                 console.print(f"{Icons.SUCCESS} Updated appcast.xml")
 
         # Verify the release artifacts before committing
-        verify_release(dmg_path, new_marketing, new_project)
+        verify_release(dmg, new_marketing, new_project)
 
         # Create git commit and tag
         if not QUIET:
             console.print()
-            console.rule("[bold blue]Git & GitHub Release[/bold blue]")
+            console.rule(section_title("Git & GitHub Release"))
 
         tag_name, pushed_to_github = create_git_commit_and_tag(new_marketing, changelog_items)
 
-        # Create dSYMs ZIP for GitHub release
-        dsyms_zip_path = create_dsyms_zip(args.archive_path, dmg_path)
+        # Wait for the dSYMs ZIP for GitHub release
+        dsyms_zip_path = dsyms_zip_future.result()
 
         # Create GitHub release
         release_url = create_github_release(
-            tag_name, dmg_path, new_marketing, dsyms_zip_path
+            tag_name, dmg, new_marketing, dsyms_zip_path
         )
 
         # Upload dSYMs to Sentry if configured
         if args.sentry_org and args.sentry_project:
             if not QUIET:
                 console.print()
-                console.rule("[bold blue]Post-Release Tasks[/bold blue]")
+                console.rule(section_title("Post-Release Tasks"))
             upload_dsyms_to_sentry(
-                args.archive_path, args.sentry_org, args.sentry_project
+                args.archive_path, args.sentry_org, args.sentry_project, dsyms_zip_path
             )
         else:
             if not QUIET:
@@ -2368,7 +3096,7 @@ def main() -> None:
 
         # Show release summary
         show_release_summary(
-            new_marketing, new_project, dmg_path, release_url, start_time, skipped_items
+            new_marketing, new_project, dmg, release_url, start_time, skipped_items
         )
 
     except ReleaseError as e:
@@ -2384,12 +3112,15 @@ def main() -> None:
                     border_style="red",
                     padding=(1, 2),
                 )
-                console.print()
-                console.print(error_panel)
+                console.print(Group("", error_panel))
             else:
-                console.print(f"\n{Icons.ERROR} Error after pushing to GitHub: {e}")
-                console.print(f"{Icons.WARNING} The commit and tag {version_str} have been pushed.")
-                console.print(f"{Icons.WARNING} Manual intervention may be required.")
+                console.print(
+                    Group(
+                        f"\n{Icons.ERROR} Error after pushing to GitHub: {e}",
+                        f"{Icons.WARNING} The commit and tag {version_str} have been pushed.",
+                        f"{Icons.WARNING} Manual intervention may be required.",
+                    )
+                )
         else:
             rollback_manager.rollback()
             if not QUIET:
@@ -2398,8 +3129,7 @@ def main() -> None:
                     border_style="red",
                     padding=(1, 2),
                 )
-                console.print()
-                console.print(error_panel)
+                console.print(Group("", error_panel))
             else:
                 console.print(f"\n{Icons.ERROR} Error: {e}")
         sys.exit(1)
@@ -2407,9 +3137,13 @@ def main() -> None:
         if pushed_to_github:
             version_str = f"v{new_marketing}" if new_marketing else "version"
             if not QUIET:
-                console.print(f"\n{Icons.WARNING} Release interrupted after pushing to GitHub!")
-                console.print(f"{Icons.WARNING} The commit and tag {version_str} have been pushed.")
-                console.print(f"{Icons.WARNING} Manual intervention may be required to complete the release.")
+                console.print(
+                    Group(
+                        f"\n{Icons.WARNING} Release interrupted after pushing to GitHub!",
+                        f"{Icons.WARNING} The commit and tag {version_str} have been pushed.",
+                        f"{Icons.WARNING} Manual intervention may be required to complete the release.",
+                    )
+                )
         else:
             rollback_manager.rollback()
             if not QUIET:
@@ -2419,9 +3153,13 @@ def main() -> None:
         if pushed_to_github:
             version_str = f"v{new_marketing}" if new_marketing else "version"
             if not QUIET:
-                console.print(f"\n{Icons.ERROR} Unexpected error after pushing to GitHub: {e}")
-                console.print(f"{Icons.WARNING} The commit and tag {version_str} have been pushed.")
-                console.print(f"{Icons.WARNING} Manual intervention may be required to complete the release.")
+                console.print(
+                    Group(
+                        f"\n{Icons.ERROR} Unexpected error after pushing to GitHub: {e}",
+                        f"{Icons.WARNING} The commit and tag {version_str} have been pushed.",
+                        f"{Icons.WARNING} Manual intervention may be required to complete the release.",
+                    )
+                )
             if DEBUG:
                 import traceback
                 traceback.print_exc()
@@ -2437,6 +3175,9 @@ def main() -> None:
             else:
                 console.print("\nRun with --debug flag for full stack trace")
         sys.exit(1)
+    finally:
+        executor.shutdown(cancel_futures=True)
+        restore_keychain_settings()
 
 
 if __name__ == "__main__":